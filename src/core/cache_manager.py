@@ -7,10 +7,32 @@ import json
 import hashlib
 import time
 import logging
+from dataclasses import dataclass
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class OperationItem:
+    """One file_operation_items row; text columns are never None."""
+
+    __slots__ = ("path", "action", "result", "detail", "size", "mtime", "quarantine_path", "created_at")
+
+    path: str
+    action: str
+    result: str
+    detail: str
+    size: Optional[int]
+    mtime: Optional[float]
+    quarantine_path: str
+    created_at: Optional[float]
+
+    def to_dict(self) -> dict:
+        # Flat fields only, so skip dataclasses.asdict()'s recursive copy.
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class CacheManager:
     SCHEMA_VERSION = 5
 
@@ -1085,6 +1107,10 @@ class CacheManager:
             return []
 
     def get_operation_items(self, op_id: int):
+        return [item.to_dict() for item in self.get_operation_item_records(op_id)]
+
+    def get_operation_item_records(self, op_id: int) -> list[OperationItem]:
+        """Items of one operation as slotted OperationItem records (get_operation_items returns dicts)."""
         if not op_id:
             return []
         try:
@@ -1097,28 +1123,15 @@ class CacheManager:
             order_by = "id ASC" if has_id else "created_at ASC"
             cur.execute(
                 f"""
-                SELECT path, action, result, detail, size, mtime, quarantine_path, created_at
+                SELECT COALESCE(path, ''), COALESCE(action, ''), COALESCE(result, ''), COALESCE(detail, ''),
+                       size, mtime, COALESCE(quarantine_path, ''), created_at
                 FROM file_operation_items
                 WHERE op_id=?
                 ORDER BY {order_by}
                 """,
                 (int(op_id),),
             )
-            out = []
-            for row in cur.fetchall():
-                out.append(
-                    {
-                        "path": row[0] or "",
-                        "action": row[1] or "",
-                        "result": row[2] or "",
-                        "detail": row[3] or "",
-                        "size": row[4],
-                        "mtime": row[5],
-                        "quarantine_path": row[6] or "",
-                        "created_at": row[7],
-                    }
-                )
-            return out
+            return [OperationItem(*row) for row in cur.fetchall()]
         except Exception as e:
             logger.exception("Get operation items error")
             return []
@@ -1246,6 +1259,8 @@ class CacheManager:
                 SELECT id, created_at, orig_path, quarantine_path, size, mtime, status
                 FROM quarantine_items
                 WHERE quarantine_path=?
+                ORDER BY id
+                LIMIT 1
                 """,
                 (str(quarantine_path),),
             )
@@ -1299,6 +1314,45 @@ class CacheManager:
             logger.exception("Get quarantine items by ids error")
         return out
 
+    def get_quarantine_items_by_paths(self, quarantine_paths: list[str]):
+        """Bulk variant of get_quarantine_item_by_path: {quarantine_path: item}."""
+        out = {}
+        paths = list(dict.fromkeys(str(p) for p in (quarantine_paths or []) if p))
+        if not paths:
+            return out
+        CHUNK_SIZE = 300
+        try:
+            conn = self._get_conn()
+            cur = conn.cursor()
+            for i in range(0, len(paths), CHUNK_SIZE):
+                chunk = paths[i:i + CHUNK_SIZE]
+                placeholders = ",".join(["?"] * len(chunk))
+                cur.execute(
+                    f"""
+                    SELECT id, created_at, orig_path, quarantine_path, size, mtime, status
+                    FROM quarantine_items
+                    WHERE quarantine_path IN ({placeholders})
+                    ORDER BY id
+                    """,
+                    chunk,
+                )
+                for row in cur.fetchall():
+                    # First row per path wins, as in get_quarantine_item_by_path.
+                    if str(row[3]) in out:
+                        continue
+                    out[str(row[3])] = {
+                        "id": row[0],
+                        "created_at": row[1],
+                        "orig_path": row[2],
+                        "quarantine_path": row[3],
+                        "size": row[4] or 0,
+                        "mtime": row[5] or 0.0,
+                        "status": row[6],
+                    }
+        except Exception as e:
+            logger.exception("Get quarantine items by paths error")
+        return out
+
     def get_cached_hash(self, path, size, mtime):
         """
         Returns (partial, full) hash if path match AND size match AND mtime match.
@@ -5,6 +5,7 @@ import os
 import platform
 import time
 import fnmatch
+import re
 import threading
 import errno
 from collections import defaultdict
@@ -32,6 +33,15 @@ IMAGE_HASH_AVAILABLE = bool(_image_hash_available())
 
 BUFFER_SIZE = 1024 * 1024  # 1MB buffer for faster I/O
 
+
+def compile_glob_union(patterns):
+    """Compile glob patterns into one regex; ``match`` succeeds if any pattern matches (fnmatchcase semantics)."""
+    pats = [str(p) for p in (patterns or []) if p]
+    if not pats:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in pats))
+
+
 class ScanWorker(QThread):
     progress_updated = Signal(int, str)
     stage_updated = Signal(str)  # stage code for UI
@@ -272,29 +282,28 @@ class ScanWorker(QThread):
         return normalized
 
     def _prepare_patterns(self, patterns):
-        prepared = []
+        """Compile patterns once into (name_regex, path_regex), or None when empty."""
+        name_pats = []
+        path_pats = []
         for pattern in patterns or []:
             if not pattern:
                 continue
             pattern_str = str(pattern)
-            name_match = pattern_str.lower() if os.name == "nt" else pattern_str
-            path_match = self._normalize_match(pattern_str)
-            prepared.append((name_match, path_match))
-        return prepared
+            name_pats.append(pattern_str.lower() if os.name == "nt" else pattern_str)
+            path_pats.append(self._normalize_match(pattern_str))
+        if not name_pats:
+            return None
+        return (compile_glob_union(name_pats), compile_glob_union(path_pats))
 
     def _matches_any_pattern(self, path: str, matchers) -> bool:
         if not matchers:
             return False
+        name_re, path_re = matchers
         name = os.path.basename(path)
         name_match = name.lower() if os.name == "nt" else name
-        path_match = self._normalize_match(path)
-
-        for name_pat, path_pat in matchers:
-            if fnmatch.fnmatchcase(name_match, name_pat):
-                return True
-            if fnmatch.fnmatchcase(path_match, path_pat):
-                return True
-        return False
+        if name_re.match(name_match):
+            return True
+        return path_re.match(self._normalize_match(path)) is not None
 
     def _should_exclude(self, path: str) -> bool:
         """Exclude check."""
@@ -1,5 +1,7 @@
 import fnmatch
+import functools
 import os
+import re
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional, Set
 
@@ -44,6 +46,63 @@ def parse_rules(rules_json: List[Dict]) -> List[SelectionRule]:
     return out
 
 
+class CompiledRules:
+    """
+    Ordered rules compiled into a single regex alternation.
+
+    Each rule becomes a named group ``r<index>``; the regex engine tries the
+    alternatives left to right, so the group that matches is the first rule
+    (by order) that accepts the string.
+    """
+
+    def __init__(self, rules: Tuple[SelectionRule, ...]):
+        # "*\\temp\\*" and "*/temp/*" normalize to the same pattern; only the first
+        # occurrence can ever win, so later duplicates are dropped from the regex.
+        self.rules: List[SelectionRule] = []
+        normalized: List[str] = []
+        seen: Set[str] = set()
+        for r in rules:
+            pat = normalize_path(r.pattern) if r.pattern else ""
+            if not pat or pat in seen:
+                continue
+            seen.add(pat)
+            self.rules.append(r)
+            normalized.append(pat)
+        parts = [f"(?P<r{i}>{fnmatch.translate(pat)})" for i, pat in enumerate(normalized)]
+        self._regex = re.compile("|".join(parts)) if parts else None
+
+    def _first_index(self, value: str) -> Optional[int]:
+        m = self._regex.match(value)
+        if m is None:
+            return None
+        return int(m.lastgroup[1:])
+
+    def first_match(self, path: str) -> Optional[SelectionRule]:
+        """Same result as the first ``rule.matches(path)`` in order, in one pass per candidate string."""
+        if self._regex is None:
+            return None
+        val = normalize_path(path)
+        best = self._first_index(val)
+        base = os.path.basename(val)
+        if base != val:
+            idx = self._first_index(base)
+            if idx is not None and (best is None or idx < best):
+                best = idx
+        return None if best is None else self.rules[best]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_rules_cached(rules: Tuple[SelectionRule, ...]) -> CompiledRules:
+    return CompiledRules(rules)
+
+
+def compile_rules(rules) -> CompiledRules:
+    """Compile (and memoize) an ordered rule list; passing a CompiledRules returns it unchanged."""
+    if isinstance(rules, CompiledRules):
+        return rules
+    return _compile_rules_cached(tuple(rules or ()))
+
+
 def _fallback_keep_oldest(paths: List[str]) -> Optional[str]:
     if not paths:
         return None
@@ -73,14 +132,15 @@ def decide_keep_delete_for_group(paths: List[str], rules: List[SelectionRule]) -
     decided_keep: Set[str] = set()
     decided_delete: Set[str] = set()
 
+    compiled = compile_rules(rules)
     for p in all_paths:
-        for rule in rules or []:
-            if rule.matches(p):
-                if rule.action == "keep":
-                    decided_keep.add(p)
-                else:
-                    decided_delete.add(p)
-                break
+        rule = compiled.first_match(p)
+        if rule is None:
+            continue
+        if rule.action == "keep":
+            decided_keep.add(p)
+        else:
+            decided_delete.add(p)
 
     remaining = set(all_paths) - decided_keep - decided_delete
 
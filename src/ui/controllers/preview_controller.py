@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
 import os
 import threading
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtGui import QImage
+from PySide6.QtCore import QObject, QSize, Qt, Signal
+from PySide6.QtGui import QImage, QImageIOHandler, QImageReader
+
+from src.utils import fast_json
 
 
 class PreviewController(QObject):
@@ -31,6 +32,11 @@ class PreviewController(QObject):
     preview_ready = Signal(object)
 
     IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".ico", ".webp"}
+    # The preview pane never shows images larger than this.
+    MAX_IMAGE_SIZE = QSize(400, 400)
+    # Bytes expected in text (same heuristic as file(1)): printable ASCII, UTF-8 high bytes, common controls.
+    _TEXT_BYTES = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F}))
+    _SNIFF_BYTES = 512
     TEXT_EXTS = {
         ".txt",
         ".py",
@@ -135,6 +141,38 @@ class PreviewController(QObject):
                     return 0
         return 512
 
+    @classmethod
+    def _looks_binary(cls, raw: bytes) -> bool:
+        """Sniff the head of ``raw``: any NUL, or more than 30% non-text bytes, means binary."""
+        sample = raw[: cls._SNIFF_BYTES]
+        if not sample:
+            return False
+        if b"\x00" in sample:
+            return True
+        return len(sample.translate(None, cls._TEXT_BYTES)) * 10 > len(sample) * 3
+
+    @classmethod
+    def _read_preview_image(cls, path: str) -> QImage:
+        """
+        Decode at (at most) preview resolution.
+
+        With a scaled size set, handlers that support it (e.g. JPEG) downsample
+        during decode, so a multi-megapixel photo never materializes at full size.
+        """
+        reader = QImageReader(path)
+        src = reader.size()
+        scaled = src.isValid() and (src.width() > cls.MAX_IMAGE_SIZE.width() or src.height() > cls.MAX_IMAGE_SIZE.height())
+        if scaled:
+            reader.setScaledSize(src.scaled(cls.MAX_IMAGE_SIZE, Qt.KeepAspectRatio))
+        img = reader.read()
+        if img.isNull() and scaled and not reader.supportsOption(QImageIOHandler.ScaledSize):
+            # Handler without scaled-read support rejected the request: decode, then shrink.
+            # (A corrupt file read by a capable handler is not decoded a second time.)
+            img = QImage(path)
+            if not img.isNull():
+                img = img.scaled(cls.MAX_IMAGE_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return img
+
     @classmethod
     def _load_preview_payload(cls, path: str) -> dict[str, Any]:
         size = None
@@ -143,7 +181,8 @@ class PreviewController(QObject):
             st = os.stat(path)
             size = int(st.st_size)
             mtime = float(st.st_mtime)
-        except Exception:
+        except (OSError, ValueError):
+            # ValueError: embedded NUL in the path
             return {"path": path, "kind": "info", "message": "missing", "size": None, "mtime": None}
 
         if os.path.isdir(path):
@@ -153,7 +192,7 @@ class PreviewController(QObject):
         ext = ext.lower()
 
         if ext in cls.IMAGE_EXTS:
-            img = QImage(path)
+            img = cls._read_preview_image(path)
             if not img.isNull():
                 return {
                     "path": path,
@@ -167,26 +206,44 @@ class PreviewController(QObject):
             return {"path": path, "kind": "info", "message": "image_unavailable", "size": size, "mtime": mtime}
 
         if ext in cls.TEXT_EXTS:
-            max_chars = 200_000
+            max_bytes = 200_000
             read_all_json = bool(ext == ".json" and size is not None and size <= 1_000_000)
             try:
-                with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read() if read_all_json else f.read(max_chars)
-                if ext == ".json" and read_all_json:
-                    try:
-                        content = json.dumps(json.loads(content), indent=4, ensure_ascii=False)
-                    except Exception:
-                        pass
-                return {
-                    "path": path,
-                    "kind": "text",
-                    "size": size,
-                    "mtime": mtime,
-                    "text": content,
-                    "image": None,
-                    "message": None,
-                }
-            except Exception:
+                # 바이너리로 한 번에 읽고 한 번만 디코딩 (TextIOWrapper 계층 생략).
+                with open(path, "rb", buffering=0) as f:
+                    if read_all_json:
+                        raw = f.read()
+                    elif ext == ".log" and size is not None and size > max_bytes:
+                        # 로그는 최근 내용이 중요하므로 끝부분을 보여줌 (잘린 첫 줄은 버림)
+                        f.seek(size - max_bytes)
+                        raw = f.read(max_bytes)
+                        raw = raw[raw.find(b"\n") + 1 :]
+                    else:
+                        raw = f.read(max_bytes)
+            except OSError:
                 return {"path": path, "kind": "info", "message": "text_unavailable", "size": size, "mtime": mtime}
+            if cls._looks_binary(raw):
+                return {"path": path, "kind": "info", "message": "binary", "size": size, "mtime": mtime}
+            # errors="ignore" also drops a multi-byte sequence cut off at the read limit.
+            content = raw.decode("utf-8", errors="ignore")
+            if "\r" in content:
+                # 텍스트 모드의 universal newline 동작 유지
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            # 객체/배열이 아니면 파싱 시도 자체를 생략 (확장자만 .json 인 파일 등)
+            if ext == ".json" and read_all_json and content.lstrip()[:1] in ("{", "["):
+                try:
+                    content = fast_json.dumps(fast_json.loads(content), indent=2)
+                except (ValueError, RecursionError):
+                    # 잘못된 JSON (JSONDecodeError 는 ValueError) 또는 지나치게 깊은 중첩
+                    pass
+            return {
+                "path": path,
+                "kind": "text",
+                "size": size,
+                "mtime": mtime,
+                "text": content,
+                "image": None,
+                "message": None,
+            }
 
         return {"path": path, "kind": "info", "message": "preview_unavailable", "size": size, "mtime": mtime}
@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
     QPushButton, QLineEdit, QLabel, QGroupBox, QMessageBox, QComboBox, QAbstractItemView
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from typing import Optional
 
@@ -42,6 +42,10 @@ class ExcludePatternsDialog(QDialog):
         ("*.zip", "ZIP archives"),
     ]
 
+    # 콤보박스 표시 문자열은 클래스 로드 시 한 번만 생성
+    _COMMON_PATTERN_ITEMS = [(f"{p} ({d})", p) for p, d in COMMON_PATTERNS]
+    _COMMON_INCLUDE_PATTERN_ITEMS = [(f"{p} ({d})", p) for p, d in COMMON_INCLUDE_PATTERNS]
+
     def __init__(
         self,
         patterns: list[str],
@@ -57,16 +61,23 @@ class ExcludePatternsDialog(QDialog):
         self._title = title
         self._desc = desc
         self._placeholder = placeholder
-        self._common_patterns = list(common_patterns) if common_patterns is not None else list(self.COMMON_PATTERNS)
+        if common_patterns is None or common_patterns is self.COMMON_PATTERNS:
+            self._common_items = self._COMMON_PATTERN_ITEMS
+        elif common_patterns is self.COMMON_INCLUDE_PATTERNS:
+            self._common_items = self._COMMON_INCLUDE_PATTERN_ITEMS
+        else:
+            self._common_items = [(f"{p} ({d})", p) for p, d in common_patterns]
+        self._app_title = strings.tr("app_title")
+        self._clear_confirm_box: Optional[QMessageBox] = None
         
         self.setWindowTitle(self._title or strings.tr("dlg_exclude_title"))
         self.setMinimumSize(500, 450)
         
-        # Apply parent theme
+        # Apply parent theme (deferred: the parent stylesheet already cascades for the first paint)
         if parent and hasattr(parent, 'settings'):
             from src.ui.theme import ModernTheme
             theme = parent.settings.value("app/theme", "light")
-            self.setStyleSheet(ModernTheme.get_stylesheet(theme))
+            QTimer.singleShot(0, self, lambda: self.setStyleSheet(ModernTheme.get_stylesheet(theme)))
         
         self.init_ui()
         self.refresh_list()
@@ -116,8 +127,8 @@ class ExcludePatternsDialog(QDialog):
         
         self.combo_presets = QComboBox()
         self.combo_presets.addItem(strings.tr("opt_select"), None)
-        for pattern, desc in self._common_patterns:
-            self.combo_presets.addItem(f"{pattern} ({desc})", pattern)
+        for label, pattern in self._common_items:
+            self.combo_presets.addItem(label, pattern)
         preset_layout.addWidget(self.combo_presets, 1)
         
         self.btn_add_preset = QPushButton(strings.tr("btn_add"))
@@ -155,16 +166,20 @@ class ExcludePatternsDialog(QDialog):
         """패턴 목록 새로고침"""
         self.pattern_list.clear()
         for pattern in self.patterns:
-            item = QListWidgetItem(pattern)
-            item.setData(Qt.ItemDataRole.UserRole, pattern)
-            self.pattern_list.addItem(item)
+            self._append_item(pattern)
+    
+    def _append_item(self, pattern: str):
+        """목록 끝에 패턴 항목 하나 추가 (전체 재구성 없이)"""
+        item = QListWidgetItem(pattern)
+        item.setData(Qt.ItemDataRole.UserRole, pattern)
+        self.pattern_list.addItem(item)
     
     def add_pattern(self):
         """새 패턴 추가"""
         pattern = self.txt_pattern.text().strip()
         if pattern and pattern not in self.patterns:
             self.patterns.append(pattern)
-            self.refresh_list()
+            self._append_item(pattern)
             self.txt_pattern.clear()
     
     def add_preset_pattern(self):
@@ -172,7 +187,7 @@ class ExcludePatternsDialog(QDialog):
         pattern = self.combo_presets.currentData()
         if pattern and pattern not in self.patterns:
             self.patterns.append(pattern)
-            self.refresh_list()
+            self._append_item(pattern)
     
     def remove_selected(self):
         """선택된 패턴 삭제"""
@@ -186,13 +201,19 @@ class ExcludePatternsDialog(QDialog):
     def clear_all(self):
         """모든 패턴 삭제"""
         if self.patterns:
-            res = QMessageBox.question(
-                self,
-                strings.tr("app_title"),
-                strings.tr("confirm_clear_patterns"),
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            )
-            if res == QMessageBox.StandardButton.Yes:
+            # 확인 대화상자는 처음 한 번만 만들고 재사용 (기본 버튼: 아니오)
+            box = self._clear_confirm_box
+            if box is None:
+                box = QMessageBox(
+                    QMessageBox.Icon.Question,
+                    self._app_title,
+                    strings.tr("confirm_clear_patterns"),
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    self,
+                )
+                box.setDefaultButton(QMessageBox.StandardButton.No)
+                self._clear_confirm_box = box
+            if box.exec() == QMessageBox.StandardButton.Yes:
                 self.patterns.clear()
                 self.refresh_list()
     
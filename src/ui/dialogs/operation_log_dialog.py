@@ -1,6 +1,5 @@
 import csv
-import json
-from datetime import datetime
+import time
 
 from PySide6.QtWidgets import (
     QDialog,
@@ -8,16 +7,87 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QFileDialog,
     QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QBrush
 
+from src.utils import fast_json
 from src.utils.i18n import strings
 
+_READ_ONLY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+_FAIL_BRUSH = QBrush(Qt.red)
+
+
+class OperationLogModel(QAbstractTableModel):
+    """Read-only table model over OperationItem records; cells are produced on demand."""
+
+    COLUMNS = ("path", "action", "result", "detail", "size", "quarantine_path")
+
+    def __init__(self, headers: list, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self.items = []
+
+    def set_items(self, items: list):
+        self.beginResetModel()
+        self.items = list(items or [])
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        it = self.items[index.row()]
+        key = self.COLUMNS[index.column()]
+        if role == Qt.DisplayRole:
+            if key == "size":
+                return str(it.size or 0)
+            # Text columns are never None on OperationItem, so no `or` fallback is needed.
+            return getattr(it, key)
+        if role == Qt.ForegroundRole and key == "result" and it.result == "fail":
+            return _FAIL_BRUSH
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return _READ_ONLY_FLAGS
+
+
+class _ItemsLoaderSignals(QObject):
+    loaded = Signal(object)  # list[dict]
+
+
+class OperationItemsLoader(QRunnable):
+    """Fetches operation items on a pool thread (cache_manager hands out per-thread connections)."""
+
+    def __init__(self, cache_manager, op_id: int):
+        super().__init__()
+        self.cache_manager = cache_manager
+        self.op_id = op_id
+        self.signals = _ItemsLoaderSignals()
+
+    def run(self):
+        try:
+            items = self.cache_manager.get_operation_item_records(self.op_id)
+        except Exception:
+            items = []
+        self.signals.loaded.emit(items)
+
 
 class OperationLogDialog(QDialog):
     def __init__(self, cache_manager, op_row: dict, parent=None):
@@ -25,7 +95,15 @@ class OperationLogDialog(QDialog):
         self.cache_manager = cache_manager
         self.op_row = op_row or {}
         self.items = []
+        self._failed_items = []
+        self._loader_signals = None
         self.retry_payload = None
+        self._app_title = strings.tr("app_title")
+        # Native pickers can be slow behind XDG portals; "ui/use_native_file_dialogs=false" opts out.
+        self._file_dialog_options = QFileDialog.Option(0)
+        if parent and hasattr(parent, "settings"):
+            if str(parent.settings.value("ui/use_native_file_dialogs", True)).lower() != "true":
+                self._file_dialog_options = QFileDialog.DontUseNativeDialog
 
         self.setWindowTitle(strings.tr("dlg_operation_details"))
         self.setMinimumSize(860, 560)
@@ -35,7 +113,8 @@ class OperationLogDialog(QDialog):
                 from src.ui.theme import ModernTheme
 
                 theme = parent.settings.value("app/theme", "light")
-                self.setStyleSheet(ModernTheme.get_stylesheet(theme))
+                # The parent's stylesheet already cascades here; re-polish after the first paint.
+                QTimer.singleShot(0, self, lambda: self.setStyleSheet(ModernTheme.get_stylesheet(theme)))
             except Exception:
                 pass
 
@@ -50,9 +129,7 @@ class OperationLogDialog(QDialog):
         self.lbl_title.setObjectName("card_title")
         layout.addWidget(self.lbl_title)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(
+        self.model = OperationLogModel(
             [
                 strings.tr("col_path"),
                 strings.tr("col_action"),
@@ -60,8 +137,13 @@ class OperationLogDialog(QDialog):
                 strings.tr("col_detail"),
                 strings.tr("col_size"),
                 strings.tr("col_quarantine_path"),
-            ]
+            ],
+            self,
         )
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setWordWrap(False)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
         header.setSectionResizeMode(1, QHeaderView.Fixed)
@@ -104,82 +186,64 @@ class OperationLogDialog(QDialog):
     def _load(self):
         op_id = int(self.op_row.get("id") or 0)
         created_at = self.op_row.get("created_at") or 0
-        dt = datetime.fromtimestamp(float(created_at)).strftime("%Y-%m-%d %H:%M") if created_at else "—"
+        dt = time.strftime("%Y-%m-%d %H:%M", time.localtime(float(created_at))) if created_at else "—"
         title = strings.tr("msg_operation_title").format(
             id=op_id,
             op_type=str(self.op_row.get("op_type") or ""),
             status=str(self.op_row.get("status") or ""),
             time=dt,
         )
-        self.lbl_title.setText(title)
-
-        self.items = self.cache_manager.get_operation_items(op_id)
-
-        self.table.setRowCount(len(self.items))
-        for r, it in enumerate(self.items):
-            path = it.get("path") or ""
-            action = it.get("action") or ""
-            result = it.get("result") or ""
-            detail = it.get("detail") or ""
-            size = it.get("size") or 0
-            qpath = it.get("quarantine_path") or ""
-
-            i0 = QTableWidgetItem(path)
-            i0.setFlags(i0.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 0, i0)
-
-            i1 = QTableWidgetItem(action)
-            i1.setFlags(i1.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 1, i1)
-
-            i2 = QTableWidgetItem(result)
-            i2.setFlags(i2.flags() & ~Qt.ItemIsEditable)
-            if result == "fail":
-                i2.setForeground(Qt.red)
-            self.table.setItem(r, 2, i2)
-
-            i3 = QTableWidgetItem(detail)
-            i3.setFlags(i3.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 3, i3)
-
-            i4 = QTableWidgetItem(str(size))
-            i4.setFlags(i4.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 4, i4)
-
-            i5 = QTableWidgetItem(qpath)
-            i5.setFlags(i5.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 5, i5)
+        self._title = title
+        self.lbl_title.setText(f"{title} • {strings.tr('msg_operation_loading')}")
 
         # Hardlink undo supported when op is hardlink and we have detail=canonical recorded.
         if str(self.op_row.get("op_type") or "") == "hardlink_consolidate":
             self.btn_undo_hardlink.setVisible(True)
 
+        # Large operations can hold many thousands of rows; read them off the UI thread
+        # so the dialog paints immediately. The signal is delivered queued to this thread.
+        self.btn_export_csv.setEnabled(False)
+        self.btn_export_json.setEnabled(False)
+        loader = OperationItemsLoader(self.cache_manager, op_id)
+        # The pool owns (and deletes) the runnable; keep its signal object alive with the dialog.
+        self._loader_signals = loader.signals
+        self._loader_signals.loaded.connect(self._apply_items, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(loader)
+
+    def _apply_items(self, items):
+        self.items = list(items or [])
+        self.lbl_title.setText(self._title)
+
+        # The view only asks the model for visible rows, so no per-cell items are built here.
+        self.model.set_items(self.items)
+        self._failed_items = [it for it in self.items if it.result == "fail"]
+        self.btn_export_csv.setEnabled(True)
+        self.btn_export_json.setEnabled(True)
+
         op_type = str(self.op_row.get("op_type") or "")
-        status = str(self.op_row.get("status") or "")
-        if status in ("partial", "failed") and op_type in ("delete_quarantine", "delete_trash", "hardlink_consolidate", "restore", "purge"):
+        if self._failed_items and op_type in ("delete_quarantine", "delete_trash", "hardlink_consolidate", "restore", "purge"):
             self.btn_retry_failed.setVisible(True)
 
     def _prepare_retry(self):
         op_type = str(self.op_row.get("op_type") or "")
-        failed_items = [it for it in (self.items or []) if str(it.get("result") or "") == "fail"]
+        failed_items = self._failed_items
         if not failed_items:
-            QMessageBox.information(self, strings.tr("app_title"), strings.tr("msg_no_items"))
+            QMessageBox.information(self, self._app_title, strings.tr("msg_no_items"))
             return
 
         if op_type in ("delete_quarantine", "delete_trash"):
-            paths = [str(it.get("path") or "") for it in failed_items if it.get("path")]
+            paths = [it.path for it in failed_items if it.path]
             if paths:
                 self.retry_payload = {"op_type": op_type, "paths": paths}
                 self.accept()
                 return
 
         if op_type in ("restore", "purge"):
+            qpaths = [it.quarantine_path for it in failed_items]
+            qitems = self.cache_manager.get_quarantine_items_by_paths([q for q in qpaths if q])
             item_ids = []
-            for it in failed_items:
-                qpath = str(it.get("quarantine_path") or "")
-                if not qpath:
-                    continue
-                qitem = self.cache_manager.get_quarantine_item_by_path(qpath)
+            for qpath in qpaths:
+                qitem = qitems.get(qpath) if qpath else None
                 if qitem and qitem.get("status") == "quarantined":
                     try:
                         item_ids.append(int(qitem.get("id") or 0))
@@ -194,49 +258,71 @@ class OperationLogDialog(QDialog):
         if op_type == "hardlink_consolidate":
             opts = self.op_row.get("options") or {}
             canonical = str(opts.get("canonical") or "")
-            targets = [str(it.get("path") or "") for it in failed_items if it.get("path")]
+            targets = [it.path for it in failed_items if it.path]
             if canonical and targets:
                 self.retry_payload = {"op_type": op_type, "options": {"canonical": canonical, "targets": targets}}
                 self.accept()
                 return
 
-        QMessageBox.information(self, strings.tr("app_title"), strings.tr("msg_retry_unavailable"))
+        QMessageBox.information(self, self._app_title, strings.tr("msg_retry_unavailable"))
 
     def _export_csv(self):
         op_id = int(self.op_row.get("id") or 0)
-        path, _ = QFileDialog.getSaveFileName(self, strings.tr("btn_export_csv2"), f"operation_{op_id}.csv", "CSV Files (*.csv)")
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            strings.tr("btn_export_csv2"),
+            f"operation_{op_id}.csv",
+            "CSV Files (*.csv)",
+            options=self._file_dialog_options,
+        )
         if not path:
             return
         try:
-            with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            # OperationItem text columns are never None; only the numeric ones need a fallback.
+            rows = (
+                (
+                    it.path,
+                    it.action,
+                    it.result,
+                    it.detail,
+                    it.size or 0,
+                    it.mtime or "",
+                    it.quarantine_path,
+                    it.created_at or "",
+                )
+                for it in self.items
+            )
+            with open(path, "w", newline="", encoding="utf-8-sig", buffering=1 << 20) as f:
                 w = csv.writer(f)
                 w.writerow(["path", "action", "result", "detail", "size", "mtime", "quarantine_path", "created_at"])
-                for it in self.items:
-                    w.writerow(
-                        [
-                            it.get("path") or "",
-                            it.get("action") or "",
-                            it.get("result") or "",
-                            it.get("detail") or "",
-                            it.get("size") or 0,
-                            it.get("mtime") or "",
-                            it.get("quarantine_path") or "",
-                            it.get("created_at") or "",
-                        ]
-                    )
-            QMessageBox.information(self, strings.tr("app_title"), strings.tr("msg_export_done").format(path))
+                w.writerows(rows)
+            QMessageBox.information(self, self._app_title, strings.tr("msg_export_done").format(path))
         except Exception as e:
-            QMessageBox.warning(self, strings.tr("app_title"), str(e))
+            QMessageBox.warning(self, self._app_title, str(e))
 
     def _export_json(self):
         op_id = int(self.op_row.get("id") or 0)
-        path, _ = QFileDialog.getSaveFileName(self, strings.tr("btn_export_json"), f"operation_{op_id}.json", "JSON Files (*.json)")
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            strings.tr("btn_export_json"),
+            f"operation_{op_id}.json",
+            "JSON Files (*.json)",
+            options=self._file_dialog_options,
+        )
         if not path:
             return
         try:
-            data = {"operation": self.op_row, "items": self.items}
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
-            QMessageBox.information(self, strings.tr("app_title"), strings.tr("msg_export_done").format(path))
+            # Stream items one per line instead of serializing the whole document in memory.
+            with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.write('{\n  "operation": ')
+                f.write(fast_json.dumps(self.op_row))
+                f.write(',\n  "items": [')
+                sep = "\n    "
+                for it in self.items:
+                    f.write(sep)
+                    f.write(fast_json.dumps(it.to_dict()))
+                    sep = ",\n    "
+                f.write("\n  ]\n}\n" if self.items else "]\n}\n")
+            QMessageBox.information(self, self._app_title, strings.tr("msg_export_done").format(path))
         except Exception as e:
-            QMessageBox.warning(self, strings.tr("app_title"), str(e))
+            QMessageBox.warning(self, self._app_title, str(e))
@@ -4,20 +4,77 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush
 
 from src.utils.i18n import strings
 
+_READ_ONLY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+_SEV_COLORS = {"block": QBrush(Qt.red), "warn": QBrush(Qt.darkYellow)}
+
+
+class IssuesModel(QAbstractTableModel):
+    """Read-only view over preflight issues; cells are produced on demand."""
+
+    def __init__(self, headers: list, severity_label, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._severity_label = severity_label
+        self.issues = []
+
+    def set_issues(self, issues: list):
+        self.beginResetModel()
+        self.issues = list(issues or [])
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.issues)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        it = self.issues[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return self._severity_label(getattr(it, "severity", "info"))
+            if col == 1:
+                return getattr(it, "path", "") or ""
+            if col == 2:
+                return getattr(it, "code", "") or ""
+            return getattr(it, "message", "") or ""
+        if role == Qt.ForegroundRole and col == 0:
+            return _SEV_COLORS.get(str(getattr(it, "severity", "")).lower())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return _READ_ONLY_FLAGS
+
 
 class PreflightDialog(QDialog):
     def __init__(self, report, parent=None):
         super().__init__(parent)
         self.report = report
         self._accepted = False
+        # Resolved once; the table model asks for these on every paint.
+        self._sev_labels = {
+            "block": strings.tr("sev_block"),
+            "warn": strings.tr("sev_warn"),
+            "info": strings.tr("sev_info"),
+        }
 
         self.setWindowTitle(strings.tr("dlg_preflight_title"))
         self.setMinimumSize(720, 520)
@@ -51,16 +108,20 @@ class PreflightDialog(QDialog):
         self.lbl_summary.setObjectName("empty_state")
         layout.addWidget(self.lbl_summary)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(
+        self.model = IssuesModel(
             [
                 strings.tr("col_severity"),
                 strings.tr("col_path"),
                 strings.tr("col_code"),
                 strings.tr("col_message"),
-            ]
+            ],
+            self._severity_label,
+            self,
         )
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setWordWrap(False)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Fixed)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
@@ -85,12 +146,7 @@ class PreflightDialog(QDialog):
         layout.addLayout(btns)
 
     def _severity_label(self, sev: str) -> str:
-        s = str(sev or "").lower()
-        if s == "block":
-            return strings.tr("sev_block")
-        if s == "warn":
-            return strings.tr("sev_warn")
-        return strings.tr("sev_info")
+        return self._sev_labels.get(str(sev or "").lower(), self._sev_labels["info"])
 
     def _populate(self):
         rep = self.report
@@ -115,34 +171,7 @@ class PreflightDialog(QDialog):
             )
         )
 
-        issues = list(getattr(rep, "issues", []) or [])
-        self.table.setRowCount(len(issues))
-
-        for r, it in enumerate(issues):
-            sev = self._severity_label(getattr(it, "severity", "info"))
-            path = getattr(it, "path", "") or ""
-            code = getattr(it, "code", "") or ""
-            msg = getattr(it, "message", "") or ""
-
-            i0 = QTableWidgetItem(sev)
-            i0.setFlags(i0.flags() & ~Qt.ItemIsEditable)
-            if str(getattr(it, "severity", "")).lower() == "block":
-                i0.setForeground(Qt.red)
-            elif str(getattr(it, "severity", "")).lower() == "warn":
-                i0.setForeground(Qt.darkYellow)
-            self.table.setItem(r, 0, i0)
-
-            i1 = QTableWidgetItem(path)
-            i1.setFlags(i1.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 1, i1)
-
-            i2 = QTableWidgetItem(code)
-            i2.setFlags(i2.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 2, i2)
-
-            i3 = QTableWidgetItem(msg)
-            i3.setFlags(i3.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 3, i3)
+        self.model.set_issues(getattr(rep, "issues", []) or [])
 
         self.btn_ok.setEnabled(self.can_proceed)
 
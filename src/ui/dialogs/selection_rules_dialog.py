@@ -10,33 +10,93 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QLineEdit,
     QComboBox,
     QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 
 from src.utils.i18n import strings
 
+_READ_ONLY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+class RulesModel(QAbstractTableModel):
+    """Table model over the dialog's rule list; edits are applied in place with row-level notifications."""
+
+    def __init__(self, rules: list, headers: list, keep_label: str, delete_label: str, parent=None):
+        super().__init__(parent)
+        self.rules = rules
+        self._headers = list(headers)
+        self._keep_label = keep_label
+        self._delete_label = delete_label
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rules)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        rule = self.rules[index.row()]
+        if index.column() == 0:
+            if role == Qt.DisplayRole:
+                return str(rule.get("pattern") or "")
+            return None
+        act = str(rule.get("action") or "keep")
+        if role == Qt.DisplayRole:
+            return self._keep_label if act == "keep" else self._delete_label
+        if role == Qt.UserRole:
+            return act
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return _READ_ONLY_FLAGS
+
+    def append_rule(self, rule: dict):
+        row = len(self.rules)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rules.append(rule)
+        self.endInsertRows()
+
+    def remove_rule(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rules[row]
+        self.endRemoveRows()
+
+    def move_rule(self, row: int, new_row: int):
+        # Qt expects the destination as the index *before* which the row is placed.
+        dest = new_row + 1 if new_row > row else new_row
+        if not self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), dest):
+            return
+        self.rules[row], self.rules[new_row] = self.rules[new_row], self.rules[row]
+        self.endMoveRows()
+
 
 class SelectionRulesDialog(QDialog):
     COMMON_PRESETS = [
-        # (pattern, action)
+        # (pattern, action) — "/" only; rule matching normalizes "\\" separators.
         ("*/temp/*", "delete"),
-        ("*\\temp\\*", "delete"),
         ("*/cache/*", "delete"),
-        ("*\\cache\\*", "delete"),
         ("*/downloads/*", "delete"),
-        ("*\\downloads\\*", "delete"),
         ("*/appdata/local/temp/*", "delete"),
-        ("*\\appdata\\local\\temp\\*", "delete"),
         ("*.tmp", "delete"),
         ("* - copy*", "delete"),
         ("* - 복사본*", "delete"),
     ]
+    # Combo labels/data built once per process rather than per dialog.
+    _COMMON_PRESET_ITEMS = [(f"{pat} ({act})", (pat, act)) for pat, act in COMMON_PRESETS]
 
     def __init__(self, rules: list, parent=None):
         super().__init__(parent)
@@ -55,7 +115,6 @@ class SelectionRulesDialog(QDialog):
                 pass
 
         self._init_ui()
-        self._refresh()
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -66,15 +125,27 @@ class SelectionRulesDialog(QDialog):
         desc.setObjectName("empty_state")
         layout.addWidget(desc)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels([strings.tr("col_pattern"), strings.tr("col_action")])
+        self._tr_keep = strings.tr("rule_keep")
+        self._tr_delete = strings.tr("rule_delete")
+        self.model = RulesModel(
+            self.rules,
+            [strings.tr("col_pattern"), strings.tr("col_action")],
+            self._tr_keep,
+            self._tr_delete,
+            self,
+        )
+        # Compiled matcher for "Test", rebuilt lazily after the rule list changes.
+        self._compiled = None
+        for sig in (self.model.rowsInserted, self.model.rowsRemoved, self.model.rowsMoved, self.model.modelReset):
+            sig.connect(self._invalidate_compiled)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
         header.setSectionResizeMode(1, QHeaderView.Fixed)
         self.table.setColumnWidth(1, 140)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
         layout.addWidget(self.table, 1)
 
         # Add row controls
@@ -84,8 +155,8 @@ class SelectionRulesDialog(QDialog):
         add_row.addWidget(self.txt_pattern, 1)
 
         self.combo_action = QComboBox()
-        self.combo_action.addItem(strings.tr("rule_keep"), "keep")
-        self.combo_action.addItem(strings.tr("rule_delete"), "delete")
+        self.combo_action.addItem(self._tr_keep, "keep")
+        self.combo_action.addItem(self._tr_delete, "delete")
         add_row.addWidget(self.combo_action)
 
         self.btn_add = QPushButton(strings.tr("btn_add"))
@@ -98,8 +169,8 @@ class SelectionRulesDialog(QDialog):
         row2 = QHBoxLayout()
         self.combo_presets = QComboBox()
         self.combo_presets.addItem(strings.tr("opt_select"), None)
-        for pat, act in self.COMMON_PRESETS:
-            self.combo_presets.addItem(f"{pat} ({act})", (pat, act))
+        for label, data in self._COMMON_PRESET_ITEMS:
+            self.combo_presets.addItem(label, data)
         row2.addWidget(self.combo_presets, 1)
 
         self.btn_add_preset = QPushButton(strings.tr("btn_add_preset"))
@@ -141,38 +212,23 @@ class SelectionRulesDialog(QDialog):
         btns.addWidget(self.btn_ok)
         layout.addLayout(btns)
 
-    def _refresh(self):
-        self.table.setRowCount(len(self.rules))
-        for r, rule in enumerate(self.rules):
-            pat = str(rule.get("pattern") or "")
-            act = str(rule.get("action") or "keep")
-            i0 = QTableWidgetItem(pat)
-            i0.setFlags(i0.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 0, i0)
-            i1 = QTableWidgetItem(strings.tr("rule_keep") if act == "keep" else strings.tr("rule_delete"))
-            i1.setData(Qt.UserRole, act)
-            i1.setFlags(i1.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(r, 1, i1)
-
     def _add_rule(self):
         pat = self.txt_pattern.text().strip()
         act = self.combo_action.currentData()
         if not pat:
             return
-        self.rules.append({"pattern": pat, "action": act})
+        self.model.append_rule({"pattern": pat, "action": act})
         self.txt_pattern.clear()
-        self._refresh()
 
     def _add_preset(self):
         data = self.combo_presets.currentData()
         if not data:
             return
         pat, act = data
-        self.rules.append({"pattern": pat, "action": act})
-        self._refresh()
+        self.model.append_rule({"pattern": pat, "action": act})
 
     def _current_row(self) -> int:
-        return int(self.table.currentRow())
+        return int(self.table.currentIndex().row())
 
     def _move(self, delta: int):
         row = self._current_row()
@@ -181,30 +237,28 @@ class SelectionRulesDialog(QDialog):
         new_row = row + int(delta)
         if new_row < 0 or new_row >= len(self.rules):
             return
-        self.rules[row], self.rules[new_row] = self.rules[new_row], self.rules[row]
-        self._refresh()
+        self.model.move_rule(row, new_row)
         self.table.selectRow(new_row)
 
     def _remove_selected(self):
         row = self._current_row()
         if row < 0 or row >= len(self.rules):
             return
-        del self.rules[row]
-        self._refresh()
+        self.model.remove_rule(row)
+
+    def _invalidate_compiled(self, *_args):
+        self._compiled = None
 
     def _test_rules(self):
         path = self.txt_test.text().strip()
         if not path:
             return
         try:
-            from src.core.selection_rules import parse_rules
-
-            rules = parse_rules(self.rules)
-            match = None
-            for r in rules:
-                if r.matches(path):
-                    match = r
-                    break
+            if self._compiled is None:
+                from src.core.selection_rules import compile_rules, parse_rules
+
+                self._compiled = compile_rules(parse_rules(self.rules))
+            match = self._compiled.first_match(path)
             if match:
                 QMessageBox.information(
                     self,
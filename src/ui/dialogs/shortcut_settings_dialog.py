@@ -43,6 +43,10 @@ class ShortcutSettingsDialog(QDialog):
                 if key in self.shortcuts:
                     self.shortcuts[key] = (value, self.shortcuts[key][1])
         
+        # 단축키 문자열 -> 행 인덱스 집합 (충돌 검사를 O(1)로).
+        # 저장된 설정에 이미 중복이 있을 수 있어 행 하나가 아닌 집합으로 둔다.
+        self._shortcut_to_rows: dict = {}
+
         self.setWindowTitle(strings.tr("dlg_shortcuts_title"))
         self.setMinimumSize(550, 500)
         
@@ -127,27 +131,41 @@ class ShortcutSettingsDialog(QDialog):
     
     def populate_table(self):
         """테이블 채우기"""
-        self.table.setRowCount(len(self.shortcuts))
-        
-        for row, (action_id, (shortcut, label_key)) in enumerate(self.shortcuts.items()):
-            # 액션 이름
-            action_name = strings.tr(label_key)
-            name_item = QTableWidgetItem(action_name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            name_item.setData(Qt.UserRole, action_id)
-            self.table.setItem(row, 0, name_item)
+        # reset_defaults에서도 호출됨: 채우는 동안 다시 그리기/시그널을 막는다.
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self.table.setRowCount(len(self.shortcuts))
+            self._shortcut_to_rows = {}
+        
+            for row, (action_id, (shortcut, label_key)) in enumerate(self.shortcuts.items()):
+                if shortcut:
+                    self._shortcut_to_rows.setdefault(shortcut, set()).add(row)
+
+                # 액션 이름
+                action_name = strings.tr(label_key)
+                name_item = QTableWidgetItem(action_name)
+                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
+                name_item.setData(Qt.UserRole, action_id)
+                self.table.setItem(row, 0, name_item)
             
-            # 현재 단축키
-            shortcut_item = QTableWidgetItem(shortcut)
-            shortcut_item.setFlags(shortcut_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 1, shortcut_item)
+                # 현재 단축키
+                shortcut_item = QTableWidgetItem(shortcut)
+                shortcut_item.setFlags(shortcut_item.flags() & ~Qt.ItemIsEditable)
+                self.table.setItem(row, 1, shortcut_item)
             
-            # 기본값
-            default_shortcut = self.DEFAULT_SHORTCUTS.get(action_id, ('', ''))[0]
-            default_item = QTableWidgetItem(default_shortcut)
-            default_item.setFlags(default_item.flags() & ~Qt.ItemIsEditable)
-            default_item.setForeground(Qt.gray)
-            self.table.setItem(row, 2, default_item)
+                # 기본값
+                default_shortcut = self.DEFAULT_SHORTCUTS.get(action_id, ('', ''))[0]
+                default_item = QTableWidgetItem(default_shortcut)
+                default_item.setFlags(default_item.flags() & ~Qt.ItemIsEditable)
+                default_item.setForeground(Qt.gray)
+                self.table.setItem(row, 2, default_item)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+        # 막아둔 currentCellChanged 대신 키 편집기를 현재 행과 맞춘다.
+        row = self.table.currentRow()
+        self.on_selection_changed(row, 1, row, 1)
     
     def on_selection_changed(self, row, col, prev_row, prev_col):
         """선택 변경 시 키 편집기 업데이트"""
@@ -166,19 +184,29 @@ class ShortcutSettingsDialog(QDialog):
         
         # 충돌 확인
         if new_key:
-            for r in range(self.table.rowCount()):
-                if r != row:
-                    existing = self.table.item(r, 1).text()
-                    if existing == new_key:
-                        action_name = self.table.item(r, 0).text()
-                        QMessageBox.warning(
-                            self, strings.tr("app_title"),
-                            strings.tr("err_shortcut_conflict").format(action_name)
-                        )
-                        return
-        
-        # 테이블 및 데이터 업데이트
-        self.table.item(row, 1).setText(new_key)
+            r = next((r for r in self._shortcut_to_rows.get(new_key, ()) if r != row), None)
+            if r is not None:
+                action_name = self.table.item(r, 0).text()
+                QMessageBox.warning(
+                    self, strings.tr("app_title"),
+                    strings.tr("err_shortcut_conflict").format(action_name)
+                )
+                return
+        
+        self._set_row_shortcut(row, new_key)
+    
+    def _set_row_shortcut(self, row: int, new_key: str):
+        """테이블, 데이터, 충돌 인덱스를 함께 갱신"""
+        item = self.table.item(row, 1)
+        old_key = item.text()
+        rows = self._shortcut_to_rows.get(old_key)
+        if rows is not None:
+            rows.discard(row)
+            if not rows:
+                del self._shortcut_to_rows[old_key]
+        if new_key:
+            self._shortcut_to_rows.setdefault(new_key, set()).add(row)
+        item.setText(new_key)
         
         action_id = self.table.item(row, 0).data(Qt.UserRole)
         old_data = self.shortcuts.get(action_id)
@@ -189,13 +217,8 @@ class ShortcutSettingsDialog(QDialog):
         """선택된 단축키 지우기"""
         row = self.table.currentRow()
         if row >= 0:
-            self.table.item(row, 1).setText("")
+            self._set_row_shortcut(row, "")
             self.key_edit.clear()
-            
-            action_id = self.table.item(row, 0).data(Qt.UserRole)
-            old_data = self.shortcuts.get(action_id)
-            if old_data:
-                self.shortcuts[action_id] = ("", old_data[1])
     
     def reset_defaults(self):
         """모든 단축키를 기본값으로 복원"""
@@ -3,12 +3,40 @@
 Empty folder finder dialog with async scanning support.
 """
 
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QPushButton, QListWidget, 
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QPushButton, QListView,
                                QLabel, QMessageBox, QHBoxLayout, QFrame, QApplication)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
 from src.core.empty_folder_finder import EmptyFolderFinder, EmptyFolderWorker
 from src.utils.i18n import strings
-from src.ui.theme import ModernTheme
+
+
+class EmptyFoldersModel(QAbstractListModel):
+    """
+    빈 폴더 경로 목록 모델
+    Plain list of paths; the view only asks for the rows it paints.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []
+
+    def set_paths(self, paths):
+        self.beginResetModel()
+        self._paths = list(paths or [])
+        self.endResetModel()
+
+    def paths(self):
+        return list(self._paths)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._paths[index.row()]
+        return None
 
 
 class EmptyFolderDialog(QDialog):
@@ -34,6 +62,9 @@ class EmptyFolderDialog(QDialog):
 
     def apply_theme(self, theme_name):
         """Apply theme styling to the dialog."""
+        # Imported here so building the dialog without a themed parent skips the theme module.
+        from src.ui.theme import ModernTheme
+
         style = ModernTheme.get_stylesheet(theme_name)
         colors = ModernTheme.get_palette(theme_name)
         
@@ -55,10 +86,13 @@ class EmptyFolderDialog(QDialog):
         header_label.setStyleSheet("font-size: 15px; font-weight: 600; padding: 8px 0;")
         layout.addWidget(header_label)
         
-        # Results list
-        self.list_widget = QListWidget()
-        self.list_widget.setMinimumHeight(350)
-        layout.addWidget(self.list_widget)
+        # Results list (model/view: no per-path item objects)
+        self.model = EmptyFoldersModel(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setMinimumHeight(350)
+        layout.addWidget(self.list_view)
         
         # Buttons
         btn_layout = QHBoxLayout()
@@ -97,7 +131,7 @@ class EmptyFolderDialog(QDialog):
     def scan_folders(self):
         """비동기적으로 빈 폴더 검색 시작"""
         self.lbl_status.setText(strings.tr("status_searching"))
-        self.list_widget.clear()
+        self.model.set_paths([])
         self.btn_scan.setEnabled(False)
         self.btn_stop.setEnabled(True)
         self.btn_delete.setEnabled(False)
@@ -119,9 +153,8 @@ class EmptyFolderDialog(QDialog):
     
     def on_scan_finished(self, empties):
         """스캔 완료 핸들러"""
-        for path in empties:
-            self.list_widget.addItem(path)
-            
+        self.model.set_paths(empties)
+
         self.lbl_status.setText(strings.tr("status_search_done").format(len(empties)))
         self.btn_delete.setEnabled(len(empties) > 0)
         self.btn_scan.setEnabled(True)
@@ -129,7 +162,8 @@ class EmptyFolderDialog(QDialog):
         self.worker = None
 
     def delete_folders(self):
-        count = self.list_widget.count()
+        targets = self.model.paths()
+        count = len(targets)
         if count == 0:
             return
         
@@ -142,12 +176,6 @@ class EmptyFolderDialog(QDialog):
         if res != QMessageBox.Yes:
             return
         
-        # Extract paths (remove the folder emoji prefix)
-        targets = []
-        for i in range(count):
-            item_text = self.list_widget.item(i).text()
-            targets.append(item_text)
-        
         deleted, failed = self.finder.delete_folders(targets)
         
         QMessageBox.information(
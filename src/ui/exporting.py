@@ -4,14 +4,34 @@ import csv
 import json
 import logging
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Tuple
 
+from src.utils import fast_json
+
 logger = logging.getLogger(__name__)
 
+# Below this many uncached paths, thread start-up costs more than the stats it overlaps.
+_PARALLEL_STAT_MIN = 64
+_STAT_WORKERS = 16
+
 
 @dataclass(frozen=True)
 class GroupInfo:
+    # No per-instance __dict__; one instance per exported group.
+    __slots__ = (
+        "group_key_json",
+        "group_type",
+        "group_kind",
+        "has_byte_compare",
+        "label",
+        "size_from_key",
+        "bytes_reclaim_est",
+        "baseline_delta",
+    )
+
     group_key_json: str
     group_type: str  # duplicate|name_only|similar|unknown
     group_kind: str  # file|folder|similar
@@ -23,17 +43,39 @@ class GroupInfo:
 
 
 def _read_fs_meta(path: str) -> tuple[str, str]:
+    # One stat() gives existence, type, size and mtime together.
     try:
-        if os.path.exists(path) and (not os.path.isdir(path)):
-            return (str(os.path.getsize(path)), str(os.path.getmtime(path)))
+        st = os.stat(path)
+    except FileNotFoundError:
+        return ("", "")
     except Exception:
         logger.debug("Failed to read file metadata for export path: %s", path, exc_info=True)
-    return ("", "")
+        return ("", "")
+    if stat.S_ISDIR(st.st_mode):
+        return ("", "")
+    return (str(st.st_size), str(st.st_mtime))
+
+
+def _path_ext(path: str) -> str:
+    """os.path.splitext(path)[1], with a fast path for the usual "name.ext" basename."""
+    dot = path.rfind(".")
+    slash = path.rfind(os.sep)
+    if os.altsep:
+        slash = max(slash, path.rfind(os.altsep))
+    if dot > slash + 1 and path[slash + 1] != ".":
+        return path[dot:]
+    if dot > slash:
+        # Dot-files (".bashrc", "..x.y") follow splitext's leading-dot rules.
+        return os.path.splitext(path)[1]
+    return ""
+
+
+_NO_PART = object()
 
 
 def _parse_group_key(key) -> GroupInfo:
     try:
-        key_json = json.dumps(key, ensure_ascii=False, default=str)
+        key_json = fast_json.dumps(key)
     except Exception:
         key_json = json.dumps(str(key), ensure_ascii=False)
 
@@ -44,44 +86,42 @@ def _parse_group_key(key) -> GroupInfo:
     bytes_reclaim_est = 0
     baseline_delta = ""
 
-    parts: List = []
-    if isinstance(key, (tuple, list)):
-        parts = list(key)
-    else:
-        parts = [key]
+    parts = key if isinstance(key, (tuple, list)) else (key,)
 
+    # One pass collects every signal the classification below needs.
+    sim = None
+    first_non_int = _NO_PART
     for p in parts:
         if isinstance(p, int):
-            size_from_key = p
-        if isinstance(p, str) and p.startswith("byte_"):
-            has_byte_compare = True
+            size_from_key = p  # last int wins
+            continue
+        if first_non_int is _NO_PART:
+            first_non_int = p
+        if isinstance(p, str):
+            if p.startswith("byte_"):
+                has_byte_compare = True
+            elif sim is None and p.startswith("similar_"):
+                sim = p
 
-    if parts and isinstance(parts[0], str) and parts[0] == "FOLDER_DUP":
+    head = parts[0] if parts else None
+    if isinstance(head, str) and head == "FOLDER_DUP":
         group_type = "folder_dup"
         if len(parts) > 1:
             label = str(parts[1])
         if len(parts) > 2 and isinstance(parts[2], int):
             bytes_reclaim_est = int(parts[2] or 0)
-    elif parts and isinstance(parts[0], str) and parts[0] == "NAME_ONLY":
+    elif isinstance(head, str) and head == "NAME_ONLY":
         group_type = "name_only"
         if len(parts) > 1:
             label = str(parts[1])
+    elif sim:
+        group_type = "similar"
+        label = sim
     else:
-        sim = None
-        for p in parts:
-            if isinstance(p, str) and p.startswith("similar_"):
-                sim = p
-                break
-        if sim:
-            group_type = "similar"
-            label = sim
-        else:
-            group_type = "duplicate"
-            # Prefer first non-int part as label (typically a hash string).
-            for p in parts:
-                if not isinstance(p, int):
-                    label = str(p)
-                    break
+        group_type = "duplicate"
+        # Prefer first non-int part as label (typically a hash string).
+        if first_non_int is not _NO_PART:
+            label = str(first_non_int)
 
     if not label:
         label = "group"
@@ -105,6 +145,16 @@ def _parse_group_key(key) -> GroupInfo:
     )
 
 
+def _prefetch_fs_meta(paths: List[str]) -> Dict[str, tuple[str, str]]:
+    """Run _read_fs_meta for many paths, overlapping the stat() calls on a thread pool."""
+    read = _read_fs_meta
+    if len(paths) < _PARALLEL_STAT_MIN:
+        return {p: read(p) for p in paths}
+    # os.stat releases the GIL, so threads hide disk/network latency.
+    with ThreadPoolExecutor(max_workers=_STAT_WORKERS, thread_name_prefix="export-stat") as ex:
+        return dict(zip(paths, ex.map(read, paths)))
+
+
 def export_scan_results_csv(
     *,
     scan_results: Dict,
@@ -121,12 +171,25 @@ def export_scan_results_csv(
     selected_set = set(selected_paths or [])
     meta_map = dict(file_meta or {})
     delta_map = dict(baseline_delta_map or {})
-    allowed_delta = {"new", "changed", "revalidated"}
+    allowed_delta = frozenset(("new", "changed", "revalidated"))
 
     groups = 0
     rows = 0
 
-    with open(out_path, "w", newline="", encoding="utf-8-sig") as f:
+    # Stat every path the caller had no metadata for up front (in parallel for big
+    # exports) so the write loop below is CPU-only.
+    missing = list(
+        dict.fromkeys(
+            p
+            for paths in (scan_results or {}).values()
+            for p in (paths or [])
+            if p and p not in meta_map
+        )
+    )
+    fs_meta = _prefetch_fs_meta(missing) if missing else {}
+
+    # 1 MiB buffer: large exports are written in few, big chunks.
+    with open(out_path, "w", newline="", encoding="utf-8-sig", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(
             [
@@ -145,26 +208,38 @@ def export_scan_results_csv(
             ]
         )
 
+        # Hot loop: bind lookups to locals and emit one writerows() call per group.
+        path_ext = _path_ext
+        delta_get = delta_map.get
+        meta_get = meta_map.get
+        is_selected = selected_set.__contains__
+        read_fs_meta = _read_fs_meta
+        fs_meta_get = fs_meta.get
+        writerows = w.writerows
+
         for key, paths in (scan_results or {}).items():
             gi = _parse_group_key(key)
             groups += 1
+            prefix = (
+                gi.group_type,
+                gi.group_kind,
+                gi.label,
+                gi.group_key_json,
+                "1" if gi.has_byte_compare else "0",
+                str(int(gi.bytes_reclaim_est or 0)),
+            )
+            batch = []
             for p in (paths or []):
                 size = ""
                 mtime = ""
                 ext = ""
                 baseline_delta = ""
                 if p:
-                    try:
-                        ext = os.path.splitext(p)[1]
-                    except Exception:
-                        ext = ""
-                    try:
-                        baseline_delta = str(delta_map.get(p) or "")
-                    except Exception:
-                        baseline_delta = ""
-                    if baseline_delta not in allowed_delta:
-                        baseline_delta = ""
-                    meta = meta_map.get(p)
+                    ext = path_ext(p)
+                    raw_delta = delta_get(p)
+                    if raw_delta in allowed_delta:
+                        baseline_delta = raw_delta
+                    meta = meta_get(p)
                     if meta and len(meta) >= 2:
                         try:
                             size = str(int(meta[0] or 0))
@@ -173,24 +248,21 @@ def export_scan_results_csv(
                             size = ""
                             mtime = ""
                     if not size:
-                        size, mtime = _read_fs_meta(p)
-
-                w.writerow(
-                    [
-                        gi.group_type,
-                        gi.group_kind,
-                        gi.label,
-                        gi.group_key_json,
-                        "1" if gi.has_byte_compare else "0",
-                        str(int(gi.bytes_reclaim_est or 0)),
+                        fetched = fs_meta_get(p)
+                        size, mtime = fetched if fetched is not None else read_fs_meta(p)
+
+                batch.append(
+                    prefix
+                    + (
                         baseline_delta,
                         p or "",
-                        "1" if (p in selected_set) else "0",
+                        "1" if is_selected(p) else "0",
                         size,
                         mtime,
                         ext,
-                    ]
+                    )
                 )
-                rows += 1
+            writerows(batch)
+            rows += len(batch)
 
     return groups, rows
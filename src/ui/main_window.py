@@ -1,6 +1,6 @@
-﻿from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QLabel, QProgressBar, QCheckBox, QMessageBox, QGroupBox, QTreeWidget, QTreeWidgetItem, QToolBar, QSpinBox, QLineEdit, QMenu, QSplitter, QTextEdit, QScrollArea, QStyle, QToolButton, QSizePolicy, QListWidget, QDoubleSpinBox, QInputDialog, QStackedWidget, QFrame, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
-from PySide6.QtCore import Qt, Slot, QSize, QSettings, QTimer
-from PySide6.QtGui import QAction, QKeySequence, QIcon, QPixmap, QFont, QCursor
+﻿from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QLabel, QProgressBar, QCheckBox, QMessageBox, QGroupBox, QTreeWidget, QTreeWidgetItem, QToolBar, QSpinBox, QLineEdit, QMenu, QSplitter, QTextEdit, QScrollArea, QStyle, QToolButton, QSizePolicy, QListWidget, QDoubleSpinBox, QInputDialog, QStackedWidget, QFrame, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QApplication)
+from PySide6.QtCore import Qt, Slot, QSize, QSettings, QTimer, QUrl
+from PySide6.QtGui import QAction, QKeySequence, QIcon, QPixmap, QPixmapCache, QCursor, QDesktopServices
 
 import os
 import sys
@@ -51,6 +51,41 @@ from src.ui.controllers.preview_controller import PreviewController
 logger = logging.getLogger(__name__)
 
 
+def _existing_paths(paths):
+    """
+    Return the entries of ``paths`` that exist, preserving order.
+
+    Siblings that share a parent are resolved with one ``scandir`` of that parent
+    instead of one ``stat`` each; single children and drive roots are stat'ed
+    directly. A name missing from the listing (e.g. different case on a
+    case-insensitive volume) is re-checked with ``os.path.exists``.
+    """
+    by_parent = {}
+    for p in paths:
+        parent, name = os.path.split(os.path.normpath(p))
+        by_parent.setdefault(parent, []).append(name)
+
+    listed = {}
+    for parent, names in by_parent.items():
+        if len(names) < 2 or not parent:
+            continue
+        try:
+            with os.scandir(parent) as it:
+                listed[parent] = {entry.name for entry in it}
+        except OSError:
+            listed[parent] = set()
+
+    result = []
+    for p in paths:
+        parent, name = os.path.split(os.path.normpath(p))
+        present = listed.get(parent)
+        if name and present is not None and name in present:
+            result.append(p)
+        elif os.path.exists(p):
+            result.append(p)
+    return result
+
+
 class DuplicateFinderApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -94,6 +129,17 @@ class DuplicateFinderApp(QMainWindow):
         self.preview_controller = PreviewController(self)
         self.preview_controller.preview_ready.connect(self._on_preview_ready, Qt.QueuedConnection)
         self._preview_request_id = 0
+        # 방향키로 빠르게 이동할 때 마지막으로 멈춘 항목만 미리보기 로드
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._request_pending_preview)
+        self._pending_preview_path = ""
+        # 결과 트리 파일 항목 컨텍스트 메뉴 (최초 사용 시 한 번만 생성)
+        self._ctx_file_menu = None
+        self._ctx_item = None
+        self._ctx_path = ""
+        # Scaled preview thumbnails are reused across clicks (keyed by path/mtime/size); 64 MB.
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 64 * 1024))
         self._current_result_meta = {}
         self._current_baseline_delta_map = {}
         self._last_scan_metrics = {}
@@ -117,6 +163,8 @@ class DuplicateFinderApp(QMainWindow):
         
         # Settings
         self.settings = QSettings("MySoft", "PyDuplicateFinderPro")
+        # 이번 세션에서 마지막으로 기록한 값 (변경 없는 키는 다시 쓰지 않음)
+        self._settings_written = {}
         self.load_settings()
 
         # Apply initial theme (defaults to light if not set)
@@ -151,6 +199,7 @@ class DuplicateFinderApp(QMainWindow):
 
     def closeEvent(self, event):
         self.save_settings()
+        self.settings.sync()
         self._flush_selected_paths()
         try:
             if hasattr(self, "preview_controller") and self.preview_controller:
@@ -228,7 +277,7 @@ class DuplicateFinderApp(QMainWindow):
                 QMessageBox.information(self, strings.tr("app_title"), strings.tr("msg_trash_warning"))
             except Exception:
                 pass
-            self.settings.setValue("ux/trash_warned", True)
+            self._set_setting("ux/trash_warned", True)
         elif hasattr(self, "toast_manager") and self.toast_manager:
             self.toast_manager.warning(strings.tr("msg_trash_warning"), duration=3500)
 
@@ -334,6 +383,7 @@ class DuplicateFinderApp(QMainWindow):
     def retranslate_ui(self):
         """Dynamic text update for language switching"""
         self.setWindowTitle(strings.tr("app_title"))
+        self._retranslate_file_context_menu()
         
         self.btn_add_folder.setText(strings.tr("btn_add_folder"))
         self.btn_add_drive.setText(strings.tr("btn_add_drive"))
@@ -799,7 +849,7 @@ class DuplicateFinderApp(QMainWindow):
     def change_language(self, lang_code):
         strings.set_language(lang_code)
         self.retranslate_ui()
-        self.settings.setValue("app/language", lang_code)
+        self._set_setting("app/language", lang_code)
         
         # theme might depend on language? Unlikely but good to refresh if needed.
 
@@ -815,7 +865,7 @@ class DuplicateFinderApp(QMainWindow):
     def apply_theme(self, theme_name):
         style = ModernTheme.get_stylesheet(theme_name)
         self.setStyleSheet(style)
-        self.settings.setValue("app/theme", theme_name)
+        self._set_setting("app/theme", theme_name)
         
         # Propagate to custom widgets
         self.tree_widget.set_theme_mode(theme_name)
@@ -1714,18 +1764,26 @@ class DuplicateFinderApp(QMainWindow):
 
         path = current.data(0, Qt.UserRole)
         if not path:
+            self._preview_timer.stop()
+            self._preview_request_id += 1
             self.show_preview_info(strings.tr("msg_select_file"))
             return
 
         path = str(path)
+        # Bump now so a payload still in flight for the previous row is dropped.
         self._preview_request_id += 1
-        request_id = int(self._preview_request_id)
+        self._pending_preview_path = path
 
         self._set_preview_info(path)
         self.show_preview_info(strings.tr("status_analyzing"), keep_info=True)
+        self._preview_timer.start(120)
 
+    def _request_pending_preview(self):
+        path = self._pending_preview_path
+        if not path:
+            return
         try:
-            self.preview_controller.request_preview(path, request_id)
+            self.preview_controller.request_preview(path, int(self._preview_request_id))
         except Exception:
             self.show_preview_info(strings.tr("msg_preview_unavailable"), keep_info=True)
 
@@ -1750,14 +1808,16 @@ class DuplicateFinderApp(QMainWindow):
         if kind == "image":
             image = (payload or {}).get("image")
             if image is not None:
-                pixmap = QPixmap.fromImage(image)
-                if not pixmap.isNull():
+                target = self.lbl_image_preview.size().boundedTo(QSize(400, 400))
+                cache_key = f"preview|{path}|{mtime}|{target.width()}x{target.height()}"
+                scaled = QPixmapCache.find(cache_key)
+                if scaled is None:
+                    pixmap = QPixmap.fromImage(image)
+                    if not pixmap.isNull():
+                        scaled = pixmap.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                        QPixmapCache.insert(cache_key, scaled)
+                if scaled is not None:
                     self._set_preview_info(path, size=size, mtime=mtime)
-                    scaled = pixmap.scaled(
-                        self.lbl_image_preview.size().boundedTo(QSize(400, 400)),
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation,
-                    )
                     self.lbl_image_preview.setPixmap(scaled)
                     self.lbl_image_preview.show()
                     self.txt_text_preview.hide()
@@ -1768,10 +1828,6 @@ class DuplicateFinderApp(QMainWindow):
             content = str((payload or {}).get("text") or "")
             self._set_preview_info(path, size=size, mtime=mtime)
             self.txt_text_preview.setPlainText(content)
-            font = QFont("Consolas")
-            font.setStyleHint(QFont.Monospace)
-            font.setPointSize(10)
-            self.txt_text_preview.setFont(font)
             self.txt_text_preview.show()
             self.lbl_image_preview.hide()
             self.lbl_info_preview.hide()
@@ -1817,17 +1873,17 @@ class DuplicateFinderApp(QMainWindow):
             except Exception:
                 pass
 
-        if size_val is None:
-            try:
-                size_val = int(os.path.getsize(path))
-            except Exception:
-                size_val = None
-
-        if mtime_val is None:
+        if size_val is None or mtime_val is None:
+            # getsize/getmtime 대신 stat 한 번으로 둘 다 얻기
             try:
-                mtime_val = float(os.path.getmtime(path))
+                st = os.stat(path)
             except Exception:
-                mtime_val = None
+                st = None
+            if st is not None:
+                if size_val is None:
+                    size_val = int(st.st_size)
+                if mtime_val is None:
+                    mtime_val = float(st.st_mtime)
 
         if size_val is not None:
             try:
@@ -1845,78 +1901,87 @@ class DuplicateFinderApp(QMainWindow):
         self.preview_info.show()
 
     # --- 疫꿸퀡???닌뗭겱: ??쇱젟 ????嚥≪뮆諭?---
+    def _set_setting(self, key, value):
+        """Write ``key`` through QSettings only if it differs from what this session last wrote."""
+        # Lists (e.g. selected_folders) are mutated in place; remember a snapshot, not the live object.
+        snapshot = tuple(value) if isinstance(value, list) else value
+        if key in self._settings_written and self._settings_written[key] == snapshot:
+            return
+        self.settings.setValue(key, value)
+        self._settings_written[key] = snapshot
+
     def save_settings(self):
-        self.settings.setValue("app/geometry", self.saveGeometry())
-        self.settings.setValue("app/splitter", self.splitter.saveState())
-        self.settings.setValue("filter/extensions", self.txt_extensions.text())
-        self.settings.setValue("filter/min_size", self.spin_min_size.value())
-        self.settings.setValue("filter/protect_system", self.chk_protect_system.isChecked())
-        self.settings.setValue("filter/byte_compare", self.chk_byte_compare.isChecked())
-        self.settings.setValue("filter/same_name", self.chk_same_name.isChecked())
-        self.settings.setValue("filter/name_only", self.chk_name_only.isChecked())
+        self._set_setting("app/geometry", self.saveGeometry())
+        self._set_setting("app/splitter", self.splitter.saveState())
+        self._set_setting("filter/extensions", self.txt_extensions.text())
+        self._set_setting("filter/min_size", self.spin_min_size.value())
+        self._set_setting("filter/protect_system", self.chk_protect_system.isChecked())
+        self._set_setting("filter/byte_compare", self.chk_byte_compare.isChecked())
+        self._set_setting("filter/same_name", self.chk_same_name.isChecked())
+        self._set_setting("filter/name_only", self.chk_name_only.isChecked())
         if hasattr(self, "chk_skip_hidden"):
-            self.settings.setValue("filter/skip_hidden", self.chk_skip_hidden.isChecked())
+            self._set_setting("filter/skip_hidden", self.chk_skip_hidden.isChecked())
         if hasattr(self, "chk_follow_symlinks"):
-            self.settings.setValue("filter/follow_symlinks", self.chk_follow_symlinks.isChecked())
-        self.settings.setValue("filter/use_trash", self.chk_use_trash.isChecked())
-        self.settings.setValue("filter/use_similar_image", self.chk_similar_image.isChecked())
+            self._set_setting("filter/follow_symlinks", self.chk_follow_symlinks.isChecked())
+        self._set_setting("filter/use_trash", self.chk_use_trash.isChecked())
+        self._set_setting("filter/use_similar_image", self.chk_similar_image.isChecked())
         if hasattr(self, "chk_mixed_mode"):
-            self.settings.setValue("filter/use_mixed_mode", self.chk_mixed_mode.isChecked())
+            self._set_setting("filter/use_mixed_mode", self.chk_mixed_mode.isChecked())
         if hasattr(self, "chk_detect_folder_dup"):
-            self.settings.setValue("filter/detect_duplicate_folders", self.chk_detect_folder_dup.isChecked())
+            self._set_setting("filter/detect_duplicate_folders", self.chk_detect_folder_dup.isChecked())
         if hasattr(self, "chk_incremental_rescan"):
-            self.settings.setValue("filter/incremental_rescan", self.chk_incremental_rescan.isChecked())
+            self._set_setting("filter/incremental_rescan", self.chk_incremental_rescan.isChecked())
         if hasattr(self, "cmb_baseline_session"):
-            self.settings.setValue("filter/baseline_session_id", int(self._get_selected_baseline_session_id() or 0))
+            self._set_setting("filter/baseline_session_id", int(self._get_selected_baseline_session_id() or 0))
         if hasattr(self, "chk_strict_mode"):
-            self.settings.setValue("filter/strict_mode", self.chk_strict_mode.isChecked())
+            self._set_setting("filter/strict_mode", self.chk_strict_mode.isChecked())
         if hasattr(self, "spin_strict_max_errors"):
-            self.settings.setValue("filter/strict_max_errors", int(self.spin_strict_max_errors.value()))
-        self.settings.setValue("filter/similarity_threshold", self.spin_similarity.value())
-        self.settings.setValue("folders", self.selected_folders)
+            self._set_setting("filter/strict_max_errors", int(self.spin_strict_max_errors.value()))
+        self._set_setting("filter/similarity_threshold", self.spin_similarity.value())
+        self._set_setting("folders", self.selected_folders)
         
         # ??ν뀧??????
         if self.custom_shortcuts:
-            self.settings.setValue("app/shortcuts", json.dumps(self.custom_shortcuts))
+            self._set_setting("app/shortcuts", json.dumps(self.custom_shortcuts))
         
         # ???쉘 ????(??筌뤴뫖以?????館鍮????곸읈 揶쏅????類ㅻ뼄??筌왖??)
         try:
-            self.settings.setValue("filter/exclude_patterns", json.dumps(self.exclude_patterns or []))
-            self.settings.setValue("filter/include_patterns", json.dumps(self.include_patterns or []))
+            self._set_setting("filter/exclude_patterns", json.dumps(self.exclude_patterns or []))
+            self._set_setting("filter/include_patterns", json.dumps(self.include_patterns or []))
         except Exception:
             pass
 
         # Selection rules
         try:
-            self.settings.setValue("rules/selection_json", json.dumps(self.selection_rules_json or []))
+            self._set_setting("rules/selection_json", json.dumps(self.selection_rules_json or []))
         except Exception:
             pass
 
         # Quarantine / advanced settings
         try:
             if hasattr(self, "chk_quarantine_enabled"):
-                self.settings.setValue("quarantine/enabled", bool(self.chk_quarantine_enabled.isChecked()))
+                self._set_setting("quarantine/enabled", bool(self.chk_quarantine_enabled.isChecked()))
             if hasattr(self, "spin_quarantine_days"):
-                self.settings.setValue("quarantine/max_days", int(self.spin_quarantine_days.value()))
+                self._set_setting("quarantine/max_days", int(self.spin_quarantine_days.value()))
             if hasattr(self, "spin_quarantine_gb"):
                 gb = int(self.spin_quarantine_gb.value())
-                self.settings.setValue("quarantine/max_bytes", int(gb) * 1024 * 1024 * 1024)
+                self._set_setting("quarantine/max_bytes", int(gb) * 1024 * 1024 * 1024)
             if hasattr(self, "txt_quarantine_path"):
-                self.settings.setValue("quarantine/path_override", str(self.txt_quarantine_path.text() or "").strip())
+                self._set_setting("quarantine/path_override", str(self.txt_quarantine_path.text() or "").strip())
             if hasattr(self, "chk_enable_hardlink"):
-                self.settings.setValue("ops/enable_hardlink", bool(self.chk_enable_hardlink.isChecked()))
+                self._set_setting("ops/enable_hardlink", bool(self.chk_enable_hardlink.isChecked()))
         except Exception:
             pass
 
         # Cache policy settings
         try:
             if hasattr(self, "spin_cache_session_keep_latest"):
-                self.settings.setValue(
+                self._set_setting(
                     "cache/session_keep_latest",
                     int(self.spin_cache_session_keep_latest.value()),
                 )
             if hasattr(self, "spin_cache_hash_cleanup_days"):
-                self.settings.setValue(
+                self._set_setting(
                     "cache/hash_cleanup_days",
                     int(self.spin_cache_hash_cleanup_days.value()),
                 )
@@ -1926,23 +1991,23 @@ class DuplicateFinderApp(QMainWindow):
         # Scheduler settings
         try:
             if hasattr(self, "chk_schedule_enabled"):
-                self.settings.setValue("schedule/enabled", bool(self.chk_schedule_enabled.isChecked()))
+                self._set_setting("schedule/enabled", bool(self.chk_schedule_enabled.isChecked()))
             if hasattr(self, "cmb_schedule_frequency"):
-                self.settings.setValue("schedule/type", str(self.cmb_schedule_frequency.currentData() or "daily"))
+                self._set_setting("schedule/type", str(self.cmb_schedule_frequency.currentData() or "daily"))
             if hasattr(self, "cmb_schedule_weekday"):
-                self.settings.setValue("schedule/weekday", int(self.cmb_schedule_weekday.currentData() or 0))
+                self._set_setting("schedule/weekday", int(self.cmb_schedule_weekday.currentData() or 0))
             if hasattr(self, "txt_schedule_time"):
                 time_hhmm = str(self.txt_schedule_time.text() or "03:00").strip() or "03:00"
                 if self._validate_schedule_time_hhmm(time_hhmm):
-                    self.settings.setValue("schedule/time_hhmm", time_hhmm)
+                    self._set_setting("schedule/time_hhmm", time_hhmm)
                 else:
                     logger.warning("Skip saving invalid schedule time: %s", time_hhmm)
             if hasattr(self, "txt_schedule_output"):
-                self.settings.setValue("schedule/output_dir", str(self.txt_schedule_output.text() or "").strip())
+                self._set_setting("schedule/output_dir", str(self.txt_schedule_output.text() or "").strip())
             if hasattr(self, "chk_schedule_export_json"):
-                self.settings.setValue("schedule/output_json", bool(self.chk_schedule_export_json.isChecked()))
+                self._set_setting("schedule/output_json", bool(self.chk_schedule_export_json.isChecked()))
             if hasattr(self, "chk_schedule_export_csv"):
-                self.settings.setValue("schedule/output_csv", bool(self.chk_schedule_export_csv.isChecked()))
+                self._set_setting("schedule/output_csv", bool(self.chk_schedule_export_csv.isChecked()))
         except Exception:
             pass
 
@@ -2004,7 +2069,7 @@ class DuplicateFinderApp(QMainWindow):
         if isinstance(folders, str): folders = [folders]
         elif not isinstance(folders, list): folders = []
         
-        self.selected_folders = [f for f in folders if os.path.exists(f)]
+        self.selected_folders = _existing_paths(folders)
         
         # Populate ListWidget
         self.list_folders.clear()
@@ -2416,114 +2481,140 @@ class DuplicateFinderApp(QMainWindow):
         if not item: return
         
         path = item.data(0, Qt.UserRole)
-        menu = QMenu()
 
         # File item context (path is stored on leaf items).
         if path:
             path = str(path)
-            action_open = QAction(self.style().standardIcon(QStyle.SP_FileIcon), strings.tr("ctx_open"), self)
-            action_open.setEnabled(os.path.exists(path) and os.path.isfile(path))
-            action_open.triggered.connect(lambda: self.open_file(item, 0))
-            menu.addAction(action_open)
-
+            menu = self._file_context_menu()
             folder = os.path.dirname(path)
-            action_folder = QAction(self.style().standardIcon(QStyle.SP_DirIcon), strings.tr("ctx_open_folder"), self)
-            action_folder.setEnabled(bool(folder) and os.path.isdir(folder))
-            action_folder.triggered.connect(lambda: self.open_containing_folder(path))
-            menu.addAction(action_folder)
-
-            menu.addSeparator()
-
-            action_copy = QAction(strings.tr("ctx_copy_path"), self)
-            action_copy.triggered.connect(lambda: self.copy_to_clipboard(path))
-            menu.addAction(action_copy)
-
-        else:
-            # Group item context
-            if item.childCount() <= 0:
-                return
-            key = item.data(0, Qt.UserRole + 1)
+            self._ctx_action_open.setEnabled(os.path.isfile(path))
+            self._ctx_action_folder.setEnabled(bool(folder) and os.path.isdir(folder))
+            self._ctx_item = item
+            self._ctx_path = path
+            try:
+                menu.exec_(self.tree_widget.viewport().mapToGlobal(position))
+            finally:
+                self._ctx_item = None
+                self._ctx_path = ""
+            return
 
-            act_check_all = QAction(strings.tr("ctx_group_check_all"), self)
-            act_check_all.triggered.connect(lambda: self.tree_widget.set_group_checked(item, True))
-            menu.addAction(act_check_all)
+        # Group item context
+        if item.childCount() <= 0:
+            return
+        key = item.data(0, Qt.UserRole + 1)
+        menu = QMenu()
 
-            act_uncheck_all = QAction(strings.tr("ctx_group_uncheck_all"), self)
-            act_uncheck_all.triggered.connect(lambda: self.tree_widget.set_group_checked(item, False))
-            menu.addAction(act_uncheck_all)
+        act_check_all = QAction(strings.tr("ctx_group_check_all"), self)
+        act_check_all.triggered.connect(lambda: self.tree_widget.set_group_checked(item, True))
+        menu.addAction(act_check_all)
 
-            if self.selection_rules:
-                act_apply_rules = QAction(strings.tr("ctx_group_apply_rules"), self)
+        act_uncheck_all = QAction(strings.tr("ctx_group_uncheck_all"), self)
+        act_uncheck_all.triggered.connect(lambda: self.tree_widget.set_group_checked(item, False))
+        menu.addAction(act_uncheck_all)
 
-                def apply_rules():
-                    paths = self.tree_widget.get_group_paths(item)
-                    keep_set, _delete_set = self.results_controller.build_keep_delete_by_rules(paths, self.selection_rules)
-                    self.tree_widget.begin_bulk_check_update()
-                    try:
-                        for j in range(item.childCount()):
-                            child = item.child(j)
-                            p = child.data(0, Qt.UserRole)
-                            if not p:
-                                continue
-                            child.setCheckState(0, Qt.Unchecked if p in keep_set else Qt.Checked)
-                    finally:
-                        self.tree_widget.end_bulk_check_update()
-
-                act_apply_rules.triggered.connect(apply_rules)
-                menu.addAction(act_apply_rules)
-
-            # Hardlink group (advanced)
-            try:
-                enabled = bool(self.chk_enable_hardlink.isChecked()) and self._is_group_key_hardlink_eligible(key)
-            except Exception:
-                enabled = False
-            if enabled:
-                act_hardlink = QAction(strings.tr("ctx_group_hardlink"), self)
+        if self.selection_rules:
+            act_apply_rules = QAction(strings.tr("ctx_group_apply_rules"), self)
 
-                def hardlink_group():
-                    checked = []
-                    unchecked = []
+            def apply_rules():
+                paths = self.tree_widget.get_group_paths(item)
+                keep_set, _delete_set = self.results_controller.build_keep_delete_by_rules(paths, self.selection_rules)
+                self.tree_widget.begin_bulk_check_update()
+                try:
                     for j in range(item.childCount()):
                         child = item.child(j)
                         p = child.data(0, Qt.UserRole)
                         if not p:
                             continue
-                        if child.checkState(0) == Qt.Checked:
-                            checked.append(p)
-                        else:
-                            unchecked.append(p)
-                    paths = self.tree_widget.get_group_paths(item)
-                    if len(paths) < 2:
-                        return
-                    # Prefer canonical from unchecked; fallback to oldest.
-                    canonical = unchecked[0] if unchecked else None
-                    if not canonical:
-                        try:
-                            canonical = min(paths, key=lambda p: self._mtime_for_path(p))
-                        except Exception:
-                            canonical = paths[0]
-                    targets = checked if checked else [p for p in paths if p != canonical]
-                    if not targets:
-                        return
-                    self._start_operation(Operation("hardlink_consolidate", options={"canonical": canonical, "targets": targets}))
-
-                act_hardlink.triggered.connect(hardlink_group)
-                menu.addAction(act_hardlink)
+                        child.setCheckState(0, Qt.Unchecked if p in keep_set else Qt.Checked)
+                finally:
+                    self.tree_widget.end_bulk_check_update()
+
+            act_apply_rules.triggered.connect(apply_rules)
+            menu.addAction(act_apply_rules)
+
+        # Hardlink group (advanced)
+        try:
+            enabled = bool(self.chk_enable_hardlink.isChecked()) and self._is_group_key_hardlink_eligible(key)
+        except Exception:
+            enabled = False
+        if enabled:
+            act_hardlink = QAction(strings.tr("ctx_group_hardlink"), self)
+
+            def hardlink_group():
+                checked = []
+                unchecked = []
+                for j in range(item.childCount()):
+                    child = item.child(j)
+                    p = child.data(0, Qt.UserRole)
+                    if not p:
+                        continue
+                    if child.checkState(0) == Qt.Checked:
+                        checked.append(p)
+                    else:
+                        unchecked.append(p)
+                paths = self.tree_widget.get_group_paths(item)
+                if len(paths) < 2:
+                    return
+                # Prefer canonical from unchecked; fallback to oldest.
+                canonical = unchecked[0] if unchecked else None
+                if not canonical:
+                    try:
+                        canonical = min(paths, key=lambda p: self._mtime_for_path(p))
+                    except Exception:
+                        canonical = paths[0]
+                targets = checked if checked else [p for p in paths if p != canonical]
+                if not targets:
+                    return
+                self._start_operation(Operation("hardlink_consolidate", options={"canonical": canonical, "targets": targets}))
+
+            act_hardlink.triggered.connect(hardlink_group)
+            menu.addAction(act_hardlink)
 
         menu.exec_(self.tree_widget.viewport().mapToGlobal(position))
 
+    def _file_context_menu(self):
+        """File-row context menu, built once; the handlers act on ``self._ctx_item`` / ``self._ctx_path``."""
+        menu = getattr(self, "_ctx_file_menu", None)
+        if menu is not None:
+            return menu
+        menu = QMenu()
+        style = self.style()
+        self._ctx_action_open = menu.addAction(style.standardIcon(QStyle.SP_FileIcon), "")
+        self._ctx_action_open.triggered.connect(self._ctx_open_file)
+        self._ctx_action_folder = menu.addAction(style.standardIcon(QStyle.SP_DirIcon), "")
+        self._ctx_action_folder.triggered.connect(self._ctx_open_folder)
+        menu.addSeparator()
+        self._ctx_action_copy = menu.addAction("")
+        self._ctx_action_copy.triggered.connect(self._ctx_copy_path)
+        self._ctx_file_menu = menu
+        self._retranslate_file_context_menu()
+        return menu
+
+    def _retranslate_file_context_menu(self):
+        if getattr(self, "_ctx_file_menu", None) is None:
+            return
+        self._ctx_action_open.setText(strings.tr("ctx_open"))
+        self._ctx_action_folder.setText(strings.tr("ctx_open_folder"))
+        self._ctx_action_copy.setText(strings.tr("ctx_copy_path"))
+
+    def _ctx_open_file(self, _checked=False):
+        if self._ctx_item is not None:
+            self.open_file(self._ctx_item, 0)
+
+    def _ctx_open_folder(self, _checked=False):
+        if self._ctx_path:
+            self.open_containing_folder(self._ctx_path)
+
+    def _ctx_copy_path(self, _checked=False):
+        if self._ctx_path:
+            self.copy_to_clipboard(self._ctx_path)
+
     def open_containing_folder(self, path):
         if not os.path.exists(path): return
-        folder = os.path.dirname(path)
-        if platform.system() == 'Windows':
-            os.startfile(folder)
-        elif platform.system() == 'Darwin':
-            subprocess.call(('open', folder))
-        else:
-            subprocess.call(('xdg-open', folder))
+        # 플랫폼 파일 관리자로 비동기 열기 (xdg-open/open 프로세스 대기 없음)
+        QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(path)))
 
     def copy_to_clipboard(self, text):
-        from PySide6.QtWidgets import QApplication
         QApplication.clipboard().setText(text)
 
     def open_cache_db_folder(self):
@@ -2535,15 +2626,7 @@ class DuplicateFinderApp(QMainWindow):
         folder = os.path.dirname(db_path) if db_path else ""
         if not folder:
             return
-        try:
-            if platform.system() == "Windows":
-                os.startfile(folder)
-            elif platform.system() == "Darwin":
-                subprocess.call(("open", folder))
-            else:
-                subprocess.call(("xdg-open", folder))
-        except Exception:
-            pass
+        QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
 
     def copy_cache_db_path(self):
         """Copy cache DB path to clipboard."""
@@ -2855,10 +2938,10 @@ class DuplicateFinderApp(QMainWindow):
             gb = int(self.spin_quarantine_gb.value())
             override = str(self.txt_quarantine_path.text() or "").strip()
 
-            self.settings.setValue("quarantine/enabled", enabled)
-            self.settings.setValue("quarantine/max_days", days)
-            self.settings.setValue("quarantine/max_bytes", gb * 1024 * 1024 * 1024)
-            self.settings.setValue("quarantine/path_override", override)
+            self._set_setting("quarantine/enabled", enabled)
+            self._set_setting("quarantine/max_days", days)
+            self._set_setting("quarantine/max_bytes", gb * 1024 * 1024 * 1024)
+            self._set_setting("quarantine/path_override", override)
 
             self.quarantine_manager._quarantine_dir = override or None
             self._apply_quarantine_retention()
@@ -2885,8 +2968,8 @@ class DuplicateFinderApp(QMainWindow):
             keep_latest = max(1, min(500, keep_latest))
             hash_cleanup_days = max(1, min(3650, hash_cleanup_days))
 
-            self.settings.setValue("cache/session_keep_latest", keep_latest)
-            self.settings.setValue("cache/hash_cleanup_days", hash_cleanup_days)
+            self._set_setting("cache/session_keep_latest", keep_latest)
+            self._set_setting("cache/hash_cleanup_days", hash_cleanup_days)
 
             self.cache_manager.cleanup_old_sessions(keep_latest=keep_latest)
             self.cache_manager.cleanup_old_entries(days_old=hash_cleanup_days)
@@ -3081,7 +3164,7 @@ class DuplicateFinderApp(QMainWindow):
             self.selection_rules_json = dlg.get_rules()
             self.selection_rules = parse_rules(self.selection_rules_json)
             try:
-                self.settings.setValue("rules/selection_json", json.dumps(self.selection_rules_json))
+                self._set_setting("rules/selection_json", json.dumps(self.selection_rules_json))
             except Exception:
                 pass
             if hasattr(self, "toast_manager") and self.toast_manager:
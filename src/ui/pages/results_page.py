@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QMenu,
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction
+from PySide6.QtGui import QAction, QFont
 
 from src.utils.i18n import strings
 from src.ui.components.results_tree import ResultsTreeWidget
@@ -174,6 +174,11 @@ def build_results_page(window) -> QWidget:
 
     window.txt_text_preview = QTextEdit()
     window.txt_text_preview.setReadOnly(True)
+    # 미리보기 폰트는 한 번만 지정 (선택 변경마다 QFont 재생성 방지)
+    preview_font = QFont("Consolas")
+    preview_font.setStyleHint(QFont.Monospace)
+    preview_font.setPointSize(10)
+    window.txt_text_preview.setFont(preview_font)
     window.txt_text_preview.hide()
     scroll_layout.addWidget(window.txt_text_preview)
 
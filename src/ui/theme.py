@@ -1,3 +1,5 @@
+import functools
+
 from PySide6.QtGui import QColor, QPalette
 
 class ModernTheme:
@@ -155,7 +157,9 @@ class ModernTheme:
         return ModernTheme.DARK_PALETTE if mode == "dark" else ModernTheme.LIGHT_PALETTE
 
     @staticmethod
+    @functools.cache
     def get_stylesheet(mode="light"):
+        # Pure function of the (small, closed) set of theme names; dialogs reuse the built string.
         c = ModernTheme.get_palette(mode)
         t = ModernTheme  # shorthand for token access
 
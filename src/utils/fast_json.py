@@ -0,0 +1,47 @@
+"""
+JSON helpers that use orjson when it is installed and fall back to the stdlib.
+
+orjson is optional; callers get the same data either way, and the stdlib path
+uses the same compact separators so encoded output matches too.
+"""
+
+import json
+import re
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+# orjson parses integers outside the 64-bit range as floats (losing digits). Any such
+# literal has at least 19 digits, so input with a digit run that long goes to the stdlib.
+_LONG_DIGITS_STR = re.compile(r"\d{19,}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19,}")
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize to a JSON string (non-ASCII kept as-is, unknown types via ``str``)."""
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64-bit; the stdlib encoder handles these.
+            pass
+    # Match orjson's layout: compact separators unless indenting.
+    separators = (",", ":") if indent is None else None
+    return json.dumps(obj, ensure_ascii=False, default=str, indent=indent, separators=separators)
+
+
+def loads(data):
+    """Parse JSON text or bytes. Raises ``ValueError`` (``json.JSONDecodeError``) on bad input."""
+    if orjson is not None:
+        pattern = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if pattern.search(data) is None:
+            return orjson.loads(data)
+    return json.loads(data)
@@ -432,6 +432,7 @@ class I18n:
                     # Operation details dialog
                     "dlg_operation_details": "Operation Details",
                     "msg_operation_title": "Operation #{id} • {op_type} • {status} • {time}",
+                    "msg_operation_loading": "Loading items...",
                     "col_action": "Action",
                     "col_result": "Result",
                     "col_detail": "Detail",
@@ -857,6 +858,7 @@ class I18n:
                     # Operation details dialog
                     "dlg_operation_details": "작업 상세",
                     "msg_operation_title": "작업 #{id} • {op_type} • {status} • {time}",
+                    "msg_operation_loading": "항목을 불러오는 중...",
                     "col_action": "작업",
                     "col_result": "결과",
                     "col_detail": "상세",
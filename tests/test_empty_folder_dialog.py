@@ -0,0 +1,25 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.ui.empty_folder_dialog import EmptyFolderDialog
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_scan_results_are_served_by_list_model(qapp, tmp_path):
+    dlg = EmptyFolderDialog([str(tmp_path)])
+    empties = [str(tmp_path / f"e{i}") for i in range(3)]
+
+    dlg.on_scan_finished(empties)
+
+    model = dlg.list_view.model()
+    assert model.rowCount() == 3
+    assert model.data(model.index(1, 0)) == empties[1]
+    assert dlg.model.paths() == empties
+    assert dlg.btn_delete.isEnabled()
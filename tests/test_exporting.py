@@ -107,3 +107,100 @@ def test_export_scan_results_writes_file_level_baseline_delta(tmp_path):
     by_path = {row["path"]: row for row in r}
     assert by_path[p1]["baseline_delta"] == "new"
     assert by_path[p2]["baseline_delta"] == "changed"
+
+
+def test_read_fs_meta_single_stat(tmp_path):
+    f = _write_file(tmp_path / "f.bin", b"12345")
+    size, mtime = exporting_module._read_fs_meta(f)
+    assert size == "5"
+    assert float(mtime) > 0
+    assert exporting_module._read_fs_meta(str(tmp_path)) == ("", "")
+    assert exporting_module._read_fs_meta(str(tmp_path / "missing")) == ("", "")
+
+
+def test_parse_group_key_keeps_element_types_of_equal_keys():
+    # ("h", 1) == ("h", 1.0) and hash alike; each must still be parsed on its own.
+    as_int = exporting_module._parse_group_key(("h", 1))
+    as_float = exporting_module._parse_group_key(("h", 1.0))
+    assert as_int.group_key_json == '["h",1]'
+    assert as_int.size_from_key == 1
+    assert as_float.group_key_json == '["h",1.0]'
+    assert as_float.size_from_key is None
+
+
+def test_group_key_json_round_trips():
+    import json
+
+    gi = exporting_module._parse_group_key(("NAME_ONLY", "사진.jpg"))
+    assert json.loads(gi.group_key_json) == ["NAME_ONLY", "사진.jpg"]
+
+
+def test_group_key_json_is_identical_with_and_without_orjson(monkeypatch):
+    import pytest
+
+    from src.utils import fast_json
+
+    if not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    keys = [("cafebabe", 42), ("NAME_ONLY", "사진.jpg"), ("similar_3", None, 1.5), ("folder", 2, "x\"y")]
+
+    with_orjson = [exporting_module._parse_group_key(k).group_key_json for k in keys]
+    monkeypatch.setattr(fast_json, "orjson", None)
+    stdlib = [exporting_module._parse_group_key(k).group_key_json for k in keys]
+
+    assert stdlib == with_orjson
+
+
+def test_path_ext_matches_splitext():
+    import os
+
+    samples = [
+        "/a/b/file.txt",
+        "/a/b/archive.tar.gz",
+        "/a/b/noext",
+        "/a/b.d/noext",
+        "/a/.bashrc",
+        "/a/..x.y",
+        "/a/...",
+        "/a/name.",
+        "rel.PNG",
+        ".hidden.cfg",
+        "",
+        "C:\\dir.x\\file",
+        "C:\\dir\\photo.jpg",
+    ]
+    for p in samples:
+        assert exporting_module._path_ext(p) == os.path.splitext(p)[1], p
+
+
+def test_missing_meta_is_prefetched_once_per_path(tmp_path, monkeypatch):
+    paths = [str(tmp_path / f"f{i}.bin") for i in range(exporting_module._PARALLEL_STAT_MIN + 5)]
+    scan_results = {("h1", 1): paths, ("h2", 1): paths[:3]}
+    seen = []
+
+    def fake_fs_meta(path):
+        seen.append(path)
+        return ("7", "1.5")
+
+    monkeypatch.setattr(exporting_module, "_read_fs_meta", fake_fs_meta)
+
+    out = tmp_path / "prefetch.csv"
+    groups, rows = export_scan_results_csv(scan_results=scan_results, out_path=str(out))
+    assert (groups, rows) == (2, len(paths) + 3)
+    assert sorted(seen) == sorted(paths)
+
+    with out.open("r", encoding="utf-8-sig", newline="") as f:
+        r = list(csv.DictReader(f))
+    assert {row["size_bytes"] for row in r} == {"7"}
+
+
+def test_parse_group_key_classification():
+    parse = exporting_module._parse_group_key
+    folder = parse(("FOLDER_DUP", "sig", 4096, 3))
+    assert (folder.group_type, folder.group_kind, folder.label, folder.bytes_reclaim_est) == ("folder_dup", "folder", "sig", 4096)
+    assert folder.size_from_key == 3
+    sim = parse(("byte_1", "similar_2", 10))
+    assert (sim.group_type, sim.label, sim.has_byte_compare) == ("similar", "similar_2", True)
+    dup = parse((None, "NAME_ONLY", 5))
+    assert (dup.group_type, dup.label, dup.size_from_key) == ("duplicate", "None", 5)
+    assert parse((7,)).label == "group"
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+import src.utils.fast_json as fast_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        if not fast_json.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+
+def test_dumps_round_trips_common_shapes(backend):
+    obj = {"path": "/tmp/한글.txt", "size": 10, "key": ("abc", 3), "nested": {"x": None}}
+    out = fast_json.dumps(obj)
+    assert "한글" in out
+    assert json.loads(out) == {"path": "/tmp/한글.txt", "size": 10, "key": ["abc", 3], "nested": {"x": None}}
+
+
+def test_dumps_falls_back_for_unknown_types_and_big_ints(backend):
+    class Odd:
+        def __str__(self):
+            return "odd"
+
+    assert json.loads(fast_json.dumps({"v": Odd(), "big": 2**70})) == {"v": "odd", "big": 2**70}
+
+
+def test_dumps_indent_and_loads(backend):
+    text = fast_json.dumps({"a": [1, 2]}, indent=2)
+    assert "\n" in text
+    assert fast_json.loads(text) == {"a": [1, 2]}
+    assert json.loads(fast_json.dumps({"a": 1}, indent=4)) == {"a": 1}
+    with pytest.raises(ValueError):
+        fast_json.loads("{not json")
+
+
+def test_loads_keeps_integers_beyond_64_bits_exact(backend):
+    text = '{"id": 123456789012345678901234567890, "neg": -9223372036854775809, "u64": 18446744073709551615, "s": 1}'
+    expected = {"id": 123456789012345678901234567890, "neg": -9223372036854775809, "u64": 18446744073709551615, "s": 1}
+    assert fast_json.loads(text) == expected
+    assert fast_json.loads(text.encode("utf-8")) == expected
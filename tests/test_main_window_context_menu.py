@@ -0,0 +1,51 @@
+import pytest
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtWidgets import QApplication, QMenu, QTreeWidgetItem
+
+from src.ui.main_window import DuplicateFinderApp
+from src.utils.i18n import strings
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_file_context_menu_is_built_once_and_retargeted(tmp_path, monkeypatch, qapp):
+    monkeypatch.setenv("PYDUPLICATEFINDER_DB_PATH", str(tmp_path / "scan_cache.db"))
+    w = DuplicateFinderApp()
+    try:
+        w._scheduler_timer.stop()
+        children = []
+        for name in ("a.txt", "b.txt"):
+            path = tmp_path / name
+            path.write_text("x")
+            child = QTreeWidgetItem()
+            child.setData(0, Qt.UserRole, str(path))
+            children.append(child)
+
+        copied = []
+        monkeypatch.setattr(w, "copy_to_clipboard", copied.append)
+        monkeypatch.setattr(w.tree_widget, "itemAt", lambda _pos: current[0])
+        menus = []
+
+        def fake_exec(menu, *_args):
+            menus.append(menu)
+            w._ctx_action_copy.trigger()
+
+        monkeypatch.setattr(QMenu, "exec_", fake_exec)
+
+        current = [children[0]]
+        w.show_context_menu(QPoint(0, 0))
+        current = [children[1]]
+        w.show_context_menu(QPoint(0, 0))
+
+        assert menus[0] is menus[1]
+        assert copied == [children[0].data(0, Qt.UserRole), children[1].data(0, Qt.UserRole)]
+        assert w._ctx_path == ""
+        assert w._ctx_action_open.text() == strings.tr("ctx_open")
+    finally:
+        w.close()
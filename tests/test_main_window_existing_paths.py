@@ -0,0 +1,27 @@
+import os
+
+import src.ui.main_window as mw_module
+
+
+def test_existing_paths_keeps_order_and_lists_shared_parent_once(tmp_path, monkeypatch):
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+    other = tmp_path / "nested" / "solo"
+    other.mkdir(parents=True)
+    folders = [
+        str(tmp_path / "c"),
+        str(other),
+        str(tmp_path / "gone"),
+        str(tmp_path / "a"),
+        str(tmp_path / "b"),
+        os.path.abspath(os.sep),
+    ]
+
+    scanned = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(mw_module.os, "scandir", lambda p: scanned.append(p) or real_scandir(p))
+
+    kept = mw_module._existing_paths(folders)
+
+    assert kept == [folders[0], folders[1], folders[3], folders[4], folders[5]]
+    assert scanned == [str(tmp_path)]
@@ -0,0 +1,33 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+
+import src.ui.main_window as mw_module
+from src.ui.main_window import DuplicateFinderApp
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_open_containing_folder_uses_desktop_services(tmp_path, monkeypatch, qapp):
+    monkeypatch.setenv("PYDUPLICATEFINDER_DB_PATH", str(tmp_path / "scan_cache.db"))
+    w = DuplicateFinderApp()
+    try:
+        w._scheduler_timer.stop()
+        target = tmp_path / "a.txt"
+        target.write_text("x")
+
+        opened = []
+        monkeypatch.setattr(mw_module.QDesktopServices, "openUrl", lambda url: opened.append(url.toLocalFile()) or True)
+        monkeypatch.setattr(mw_module.subprocess, "call", lambda *_a, **_k: pytest.fail("subprocess should not be used"))
+
+        w.open_containing_folder(str(target))
+        w.open_containing_folder(str(tmp_path / "missing.txt"))
+
+        assert opened == [str(tmp_path)]
+    finally:
+        w.close()
@@ -0,0 +1,38 @@
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QTreeWidgetItem
+
+from src.ui.main_window import DuplicateFinderApp
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_rapid_selection_changes_request_only_the_last_preview(tmp_path, monkeypatch, qapp):
+    monkeypatch.setenv("PYDUPLICATEFINDER_DB_PATH", str(tmp_path / "scan_cache.db"))
+    w = DuplicateFinderApp()
+    try:
+        w._scheduler_timer.stop()
+        requested = []
+        monkeypatch.setattr(w.preview_controller, "request_preview", lambda path, rid: requested.append((path, rid)))
+
+        items = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            item = QTreeWidgetItem()
+            item.setData(0, Qt.UserRole, str(tmp_path / name))
+            items.append(item)
+
+        for item in items:
+            w.update_preview(item, None)
+        assert requested == []
+
+        QTest.qWait(250)
+        assert requested == [(str(tmp_path / "c.txt"), w._preview_request_id)]
+    finally:
+        w.close()
@@ -0,0 +1,54 @@
+import pytest
+from PySide6.QtCore import QSettings
+from PySide6.QtWidgets import QApplication
+
+from src.ui.main_window import DuplicateFinderApp
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class _RecordingSettings:
+    def __init__(self, path):
+        self._inner = QSettings(path, QSettings.IniFormat)
+        self.writes = []
+
+    def setValue(self, key, value):
+        self.writes.append(key)
+        self._inner.setValue(key, value)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+def test_save_settings_only_rewrites_changed_keys(tmp_path, monkeypatch, qapp):
+    monkeypatch.setenv("PYDUPLICATEFINDER_DB_PATH", str(tmp_path / "scan_cache.db"))
+    w = DuplicateFinderApp()
+    try:
+        w._scheduler_timer.stop()
+        w.settings = _RecordingSettings(str(tmp_path / "settings.ini"))
+
+        w.save_settings()
+        assert "filter/min_size" in w.settings.writes
+
+        w.settings.writes.clear()
+        w.spin_min_size.setValue(w.spin_min_size.value() + 1)
+        w.save_settings()
+        assert w.settings.writes == ["filter/min_size"]
+        assert int(w.settings.value("filter/min_size")) == w.spin_min_size.value()
+
+        # selected_folders is mutated in place by add/remove; the change must still be saved.
+        w.settings.writes.clear()
+        w.selected_folders.append(str(tmp_path))
+        w.save_settings()
+        assert w.settings.writes == ["folders"]
+        assert list(w.settings.value("folders")) == w.selected_folders
+        assert w.selected_folders[-1] == str(tmp_path)
+    finally:
+        w.settings = QSettings(str(tmp_path / "close.ini"), QSettings.IniFormat)
+        w.close()
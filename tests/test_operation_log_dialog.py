@@ -0,0 +1,107 @@
+import pytest
+from PySide6.QtCore import Qt, QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from src.core.cache_manager import OperationItem
+from src.ui.dialogs.operation_log_dialog import OperationLogDialog
+
+_BLANK = {
+    "path": "",
+    "action": "",
+    "result": "",
+    "detail": "",
+    "size": None,
+    "mtime": None,
+    "quarantine_path": "",
+    "created_at": None,
+}
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class _FakeCache:
+    def __init__(self, items):
+        self._items = items
+
+    def get_operation_item_records(self, _op_id):
+        return [OperationItem(**{**_BLANK, **it}) for it in self._items]
+
+
+def _open(items, op_row):
+    dlg = OperationLogDialog(_FakeCache(items), op_row)
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+    return dlg
+
+
+def test_operation_log_model_serves_rows_without_item_widgets(qapp):
+    items = [
+        {"path": "/a.txt", "action": "trash", "result": "ok", "detail": "", "size": 10, "quarantine_path": ""},
+        {"path": "/b.txt", "action": "trash", "result": "fail", "detail": "locked", "size": None, "quarantine_path": ""},
+    ]
+    dlg = _open(items, {"id": 7, "op_type": "delete_trash", "status": "partial"})
+    model = dlg.table.model()
+
+    assert model.rowCount() == 2
+    assert model.columnCount() == 6
+    assert model.data(model.index(0, 0)) == "/a.txt"
+    assert model.data(model.index(1, 4)) == "0"
+    assert model.data(model.index(0, 2), Qt.ForegroundRole) is None
+    assert model.data(model.index(1, 2), Qt.ForegroundRole) is not None
+    assert not (model.flags(model.index(0, 0)) & Qt.ItemIsEditable)
+    assert not dlg.btn_retry_failed.isHidden()
+
+
+def test_retry_button_follows_failed_items_collected_on_load(qapp):
+    ok_only = [{"path": "/a.txt", "action": "trash", "result": "ok", "detail": "", "size": 1, "quarantine_path": ""}]
+    dlg = _open(ok_only, {"id": 1, "op_type": "delete_trash", "status": "partial"})
+    assert dlg._failed_items == []
+    assert dlg.btn_retry_failed.isHidden()
+
+
+def test_items_are_fetched_off_the_ui_thread(qapp):
+    import threading
+
+    seen = []
+
+    class _ThreadCache(_FakeCache):
+        def get_operation_item_records(self, op_id):
+            seen.append(threading.current_thread() is threading.main_thread())
+            return super().get_operation_item_records(op_id)
+
+    dlg = OperationLogDialog(_ThreadCache([{"path": "/a", "result": "ok"}]), {"id": 3, "op_type": "delete_trash"})
+    assert not dlg.btn_export_csv.isEnabled()
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+    assert seen == [False]
+    assert dlg.model.rowCount() == 1
+    assert dlg.btn_export_csv.isEnabled()
+
+
+def test_native_file_dialogs_can_be_disabled_via_settings(qapp):
+    from PySide6.QtWidgets import QFileDialog, QWidget
+
+    class _Settings:
+        def __init__(self, values):
+            self._values = values
+
+        def value(self, key, default=None):
+            return self._values.get(key, default)
+
+    class _Parent(QWidget):
+        def __init__(self, native):
+            super().__init__()
+            self.settings = _Settings({"ui/use_native_file_dialogs": native})
+
+    default = OperationLogDialog(_FakeCache([]), {"id": 1}, _Parent("true"))
+    assert default._file_dialog_options == QFileDialog.Option(0)
+    opted_out = OperationLogDialog(_FakeCache([]), {"id": 1}, _Parent("false"))
+    assert opted_out._file_dialog_options == QFileDialog.DontUseNativeDialog
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
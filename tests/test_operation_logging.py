@@ -50,6 +50,23 @@ class TestOperationLogging(unittest.TestCase):
         self.assertEqual(out[id1]["orig_path"], "o1")
         self.assertEqual(out[id2]["quarantine_path"], "q2")
 
+    def test_get_quarantine_items_by_paths(self):
+        id1 = self.cache.insert_quarantine_item("o1", "q1", size=1, mtime=1.0, status="quarantined")
+        self.cache.insert_quarantine_item("o2", "q2", size=2, mtime=2.0, status="purged")
+        out = self.cache.get_quarantine_items_by_paths(["q1", "q2", "missing", "", "q1"])
+        self.assertEqual(set(out), {"q1", "q2"})
+        self.assertEqual(out["q1"]["id"], id1)
+        self.assertEqual(out["q2"]["status"], "purged")
+        self.assertEqual(self.cache.get_quarantine_items_by_paths([]), {})
+
+    def test_get_quarantine_items_by_paths_matches_single_lookup_for_shared_path(self):
+        first = self.cache.insert_quarantine_item("o1", "shared", size=1, mtime=1.0, status="purged")
+        self.cache.insert_quarantine_item("o2", "shared", size=2, mtime=2.0, status="quarantined")
+        bulk = self.cache.get_quarantine_items_by_paths(["shared"])
+        single = self.cache.get_quarantine_item_by_path("shared")
+        self.assertEqual(single["id"], first)
+        self.assertEqual(bulk["shared"], single)
+
     def test_append_operation_items_preserves_duplicate_paths(self):
         op_id = self.cache.create_operation("delete_quarantine", {})
         self.assertTrue(op_id > 0)
@@ -67,6 +84,10 @@ class TestOperationLogging(unittest.TestCase):
         self.assertEqual(items[0]["detail"], "first")
         self.assertEqual(items[1]["detail"], "second")
 
+        records = self.cache.get_operation_item_records(op_id)
+        self.assertEqual([r.detail for r in records], ["first", "second"])
+        self.assertEqual(records[0].to_dict(), items[0])
+
     def test_update_scan_job_run_session(self):
         self.cache.upsert_scan_job(
             name="default",
@@ -0,0 +1,78 @@
+from PySide6.QtGui import QColor, QImage
+
+from src.ui.controllers.preview_controller import PreviewController
+
+
+def test_large_images_are_decoded_at_preview_size(tmp_path):
+    path = str(tmp_path / "big.png")
+    src = QImage(1600, 800, QImage.Format_RGB32)
+    src.fill(QColor("red"))
+    assert src.save(path)
+
+    payload = PreviewController._load_preview_payload(path)
+
+    assert payload["kind"] == "image"
+    img = payload["image"]
+    assert (img.width(), img.height()) == (400, 200)
+
+
+def test_small_images_keep_their_size(tmp_path):
+    path = str(tmp_path / "small.png")
+    src = QImage(40, 30, QImage.Format_RGB32)
+    src.fill(QColor("blue"))
+    assert src.save(path)
+
+    img = PreviewController._load_preview_payload(path)["image"]
+    assert (img.width(), img.height()) == (40, 30)
+
+
+
+class _FailingReader:
+    """QImageReader stand-in whose scaled read fails (as for a corrupt file)."""
+
+    def __init__(self, path, supports_scaled):
+        self._path = path
+        self._supports_scaled = supports_scaled
+
+    def size(self):
+        return QImage(self._path).size()
+
+    def setScaledSize(self, _size):
+        pass
+
+    def read(self):
+        return QImage()
+
+    def supportsOption(self, _option):
+        return self._supports_scaled
+
+
+def _big_png(tmp_path):
+    path = str(tmp_path / "big.png")
+    src = QImage(1600, 800, QImage.Format_RGB32)
+    src.fill(QColor("green"))
+    assert src.save(path)
+    return path
+
+
+def test_failed_scaled_read_is_not_retried_at_full_size(tmp_path, monkeypatch):
+    from src.ui.controllers import preview_controller
+
+    path = _big_png(tmp_path)
+    monkeypatch.setattr(preview_controller, "QImageReader", lambda p: _FailingReader(p, supports_scaled=True))
+
+    payload = PreviewController._load_preview_payload(path)
+
+    assert payload["kind"] == "info"
+    assert payload["message"] == "image_unavailable"
+
+
+def test_fallback_decode_is_scaled_to_preview_size(tmp_path, monkeypatch):
+    from src.ui.controllers import preview_controller
+
+    path = _big_png(tmp_path)
+    monkeypatch.setattr(preview_controller, "QImageReader", lambda p: _FailingReader(p, supports_scaled=False))
+
+    img = PreviewController._load_preview_payload(path)["image"]
+
+    assert (img.width(), img.height()) == (400, 200)
@@ -0,0 +1,107 @@
+from src.ui.controllers.preview_controller import PreviewController
+
+
+def test_text_preview_normalizes_newlines(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes("첫 줄\r\nsecond\rthird\n".encode("utf-8"))
+
+    payload = PreviewController._load_preview_payload(str(path))
+
+    assert payload["kind"] == "text"
+    assert payload["text"] == "첫 줄\nsecond\nthird\n"
+
+
+def test_text_preview_drops_multibyte_char_cut_at_read_limit(tmp_path):
+    path = tmp_path / "big.txt"
+    # 199_999 ASCII bytes followed by a 3-byte character straddling the 200_000 byte limit.
+    path.write_bytes(b"a" * 199_999 + "한".encode("utf-8") + b"tail")
+
+    text = PreviewController._load_preview_payload(str(path))["text"]
+
+    assert text == "a" * 199_999
+
+
+def test_json_preview_skips_parse_for_non_json_content(tmp_path, monkeypatch):
+    from src.utils import fast_json
+
+    calls = []
+    real_loads = fast_json.loads
+    monkeypatch.setattr(fast_json, "loads", lambda s: calls.append(s) or real_loads(s))
+
+    bogus = tmp_path / "not_really.json"
+    bogus.write_text("plain text, misnamed", encoding="utf-8")
+    assert PreviewController._load_preview_payload(str(bogus))["text"] == "plain text, misnamed"
+    assert calls == []
+
+    good = tmp_path / "data.json"
+    good.write_text('  {"a": [1]}', encoding="utf-8")
+    text = PreviewController._load_preview_payload(str(good))["text"]
+    assert len(calls) == 1
+    assert real_loads(text) == {"a": [1]}
+
+
+def test_json_preview_is_pretty_printed_with_two_space_indent(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"이름":"값","n":[1,2]}', encoding="utf-8")
+
+    text = PreviewController._load_preview_payload(str(path))["text"]
+
+    assert text == '{\n  "이름": "값",\n  "n": [\n    1,\n    2\n  ]\n}'
+
+
+def test_malformed_json_preview_falls_back_to_raw_text(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"a": [1, 2', encoding="utf-8")
+
+    payload = PreviewController._load_preview_payload(str(path))
+
+    assert payload["kind"] == "text"
+    assert payload["text"] == '{"a": [1, 2'
+
+
+def test_binary_content_with_text_extension_is_not_decoded(tmp_path):
+    nul = tmp_path / "rotated.log"
+    nul.write_bytes(b"\x1f\x8b\x08\x00" + bytes(range(256)) * 4)
+    controls = tmp_path / "controls.txt"
+    controls.write_bytes(bytes([1, 2, 3, 4, 5]) * 40 + b"text" * 20)
+
+    for path in (nul, controls):
+        payload = PreviewController._load_preview_payload(str(path))
+        assert payload["kind"] == "info"
+        assert payload["message"] == "binary"
+
+
+def test_utf8_text_is_not_mistaken_for_binary(tmp_path):
+    path = tmp_path / "ko.txt"
+    path.write_text("중복 파일 찾기\t탭\x1b[0m\n" * 50, encoding="utf-8")
+
+    assert PreviewController._load_preview_payload(str(path))["kind"] == "text"
+
+
+def test_large_log_preview_shows_the_tail_from_a_line_boundary(tmp_path):
+    path = tmp_path / "app.log"
+    lines = [f"line {i:06d}\n" for i in range(30_000)]
+    path.write_text("".join(lines), encoding="utf-8")
+
+    text = PreviewController._load_preview_payload(str(path))["text"]
+
+    assert text.endswith(lines[-1])
+    assert text.startswith("line ")
+    assert text in "".join(lines)
+    assert len(text.encode("utf-8")) <= 200_000
+
+
+def test_small_log_preview_reads_from_the_start(tmp_path):
+    path = tmp_path / "small.log"
+    path.write_text("first\nsecond\n", encoding="utf-8")
+
+    assert PreviewController._load_preview_payload(str(path))["text"] == "first\nsecond\n"
+
+
+def test_json_preview_keeps_big_integers_exact(tmp_path):
+    path = tmp_path / "ids.json"
+    path.write_text('{"id": 123456789012345678901234567890}', encoding="utf-8")
+
+    text = PreviewController._load_preview_payload(str(path))["text"]
+
+    assert "123456789012345678901234567890" in text
@@ -0,0 +1,36 @@
+from src.core.scanner import ScanWorker, compile_glob_union
+
+
+def _scan_files(root: str, **kwargs):
+    worker = ScanWorker([root], protect_system=False, max_workers=1, **kwargs)
+    try:
+        worker._scan_files()
+        return set(worker._file_meta.keys())
+    finally:
+        worker.cache_manager.close_all()
+
+
+def test_compile_glob_union_matches_any_pattern():
+    rx = compile_glob_union(["*.log", "node_modules", ""])
+    assert rx.match("app.log")
+    assert rx.match("node_modules")
+    assert not rx.match("app.log.txt")
+    assert not rx.match("node_modules_x")
+    assert compile_glob_union([]) is None
+
+
+def test_exclude_and_include_patterns_use_name_and_path(tmp_path):
+    keep = tmp_path / "keep.txt"
+    skip_log = tmp_path / "skip.log"
+    nested = tmp_path / "build" / "out.txt"
+    nested.parent.mkdir()
+    for p in (keep, skip_log, nested):
+        p.write_text("x", encoding="utf-8")
+
+    files = _scan_files(str(tmp_path), exclude_patterns=["*.log", "*/build/*"])
+    assert str(keep) in files
+    assert str(skip_log) not in files
+    assert str(nested) not in files
+
+    files = _scan_files(str(tmp_path), include_patterns=["*.log"])
+    assert files == {str(skip_log)}
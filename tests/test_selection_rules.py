@@ -2,7 +2,7 @@ import os
 import tempfile
 import unittest
 
-from src.core.selection_rules import decide_keep_delete_for_group, parse_rules
+from src.core.selection_rules import compile_rules, decide_keep_delete_for_group, parse_rules
 
 
 class SelectionRulesTests(unittest.TestCase):
@@ -53,6 +53,33 @@ class SelectionRulesTests(unittest.TestCase):
             self.assertEqual(keep_set, {p1})
             self.assertEqual(delete_set, {p2, p3})
 
+    def test_compiled_rules_first_match_follows_rule_order(self):
+        rules = parse_rules(
+            [
+                {"pattern": "*/cache/*", "action": "delete"},
+                {"pattern": "*.tmp", "action": "keep"},
+                {"pattern": "*", "action": "delete"},
+            ]
+        )
+        compiled = compile_rules(rules)
+        for path in ["/x/cache/a.tmp", "/x/a.tmp", "/x/a.bin", "a.tmp", ""]:
+            expected = next((r for r in rules if r.matches(path)), None)
+            self.assertEqual(compiled.first_match(path), expected, path)
+        self.assertIs(compile_rules(compiled), compiled)
+        self.assertIsNone(compile_rules([]).first_match("/x/a.tmp"))
+
+
+    def test_compiled_rules_collapse_separator_variants(self):
+        rules = parse_rules(
+            [
+                {"pattern": "*/temp/*", "action": "delete"},
+                {"pattern": "*\\temp\\*", "action": "keep"},
+            ]
+        )
+        compiled = compile_rules(rules)
+        self.assertEqual(compiled.rules, rules[:1])
+        self.assertEqual(compiled.first_match("C:\\Users\\me\\temp\\a.txt"), rules[0])
+        self.assertEqual(compiled.first_match("/home/me/temp/a.txt"), rules[0])
 
 if __name__ == "__main__":
     unittest.main()
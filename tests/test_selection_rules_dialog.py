@@ -0,0 +1,50 @@
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from src.ui.dialogs.selection_rules_dialog import SelectionRulesDialog
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _patterns(dlg):
+    model = dlg.table.model()
+    return [model.data(model.index(r, 0)) for r in range(model.rowCount())]
+
+
+def test_rules_model_add_move_remove_in_place(qapp):
+    dlg = SelectionRulesDialog([{"pattern": "*.a", "action": "keep"}, {"pattern": "*.b", "action": "delete"}])
+    model = dlg.table.model()
+    assert _patterns(dlg) == ["*.a", "*.b"]
+    assert model.data(model.index(1, 1), Qt.UserRole) == "delete"
+
+    dlg.txt_pattern.setText("*.c")
+    dlg._add_rule()
+    assert _patterns(dlg) == ["*.a", "*.b", "*.c"]
+
+    dlg.table.selectRow(0)
+    dlg._move(1)
+    assert _patterns(dlg) == ["*.b", "*.a", "*.c"]
+    assert dlg._current_row() == 1
+
+    dlg._move(-1)
+    assert _patterns(dlg) == ["*.a", "*.b", "*.c"]
+    assert dlg._current_row() == 0
+
+    dlg._remove_selected()
+    assert _patterns(dlg) == ["*.b", "*.c"]
+    assert [r["pattern"] for r in dlg.get_rules()] == ["*.b", "*.c"]
+
+
+def test_compiled_matcher_is_rebuilt_after_rule_changes(qapp):
+    dlg = SelectionRulesDialog([{"pattern": "*.a", "action": "keep"}])
+    dlg._compiled = object()
+    dlg.txt_pattern.setText("*.b")
+    dlg._add_rule()
+    assert dlg._compiled is None
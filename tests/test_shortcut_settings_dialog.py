@@ -0,0 +1,61 @@
+import pytest
+from PySide6.QtGui import QKeySequence
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from src.ui.dialogs.shortcut_settings_dialog import ShortcutSettingsDialog
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _row_of(dlg, action_id):
+    keys = list(dlg.shortcuts)
+    return keys.index(action_id)
+
+
+def test_conflicting_key_is_rejected_via_index(qapp, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(QMessageBox, "warning", lambda *a, **k: warnings.append(a))
+    dlg = ShortcutSettingsDialog({})
+
+    undo_row = _row_of(dlg, "undo")
+    dlg.table.setCurrentCell(undo_row, 1)
+    dlg.key_edit.setKeySequence(QKeySequence("Ctrl+Y"))  # redo's default
+    dlg.on_key_changed()
+    assert len(warnings) == 1
+    assert dlg.get_shortcuts()["undo"] == "Ctrl+Z"
+
+    dlg.key_edit.setKeySequence(QKeySequence("Ctrl+U"))
+    dlg.on_key_changed()
+    assert dlg.get_shortcuts()["undo"] == "Ctrl+U"
+
+    # The freed key can now be taken by another action without a conflict.
+    redo_row = _row_of(dlg, "redo")
+    dlg.table.setCurrentCell(redo_row, 1)
+    dlg.key_edit.setKeySequence(QKeySequence("Ctrl+Z"))
+    dlg.on_key_changed()
+    assert len(warnings) == 1
+    assert dlg.get_shortcuts()["redo"] == "Ctrl+Z"
+
+    dlg.clear_selected_shortcut()
+    assert dlg.get_shortcuts()["redo"] == ""
+    assert "Ctrl+Z" not in dlg._shortcut_to_rows
+
+
+def test_reset_defaults_repopulates_and_syncs_editor(qapp, monkeypatch):
+    monkeypatch.setattr(QMessageBox, "question", lambda *a, **k: QMessageBox.Yes)
+    dlg = ShortcutSettingsDialog({"undo": "Ctrl+U"})
+    row = _row_of(dlg, "undo")
+    dlg.table.setCurrentCell(row, 1)
+    assert dlg.key_edit.keySequence().toString() == "Ctrl+U"
+
+    dlg.reset_defaults()
+    assert dlg.get_shortcuts()["undo"] == "Ctrl+Z"
+    assert dlg.key_edit.keySequence().toString() == "Ctrl+Z"
+    assert dlg.table.signalsBlocked() is False
+    assert dlg.table.updatesEnabled()